@@ -4,6 +4,9 @@
 Display the fortress banner when running tests or accessing the infrastructure
 """
 
+import sys
+from functools import lru_cache
+
 FORTRESS_BANNER = """
 ⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡🏰⚡
                                                                          
@@ -60,18 +63,24 @@ Supreme Blender 4.5+ Compatibility Validation
 STATUS: SUPREMELY OPERATIONAL ⚡🏰⚡
 """
 
+@lru_cache(maxsize=4)
+def render_fortress_banner(compact=False):
+    """Fortress banner text, as display_fortress_banner prints it"""
+    return (FORTRESS_COMPACT_BANNER if compact else FORTRESS_BANNER) + "\n"
+
+@lru_cache(maxsize=16)
+def render_testing_header(test_name=""):
+    """Testing header text, as display_testing_header prints it"""
+    rule = "🏰" + "="*80 + "🏰"
+    return f"{rule}\n⚡ NAZARICK FORTRESS TESTING: {test_name}\n{rule}\n"
+
 def display_fortress_banner(compact=False):
     """Display the fortress banner"""
-    if compact:
-        print(FORTRESS_COMPACT_BANNER)
-    else:
-        print(FORTRESS_BANNER)
+    sys.stdout.write(render_fortress_banner(compact))
 
 def display_testing_header(test_name=""):
     """Display testing header with fortress branding"""
-    print("🏰" + "="*80 + "🏰")
-    print(f"⚡ NAZARICK FORTRESS TESTING: {test_name}")
-    print("🏰" + "="*80 + "🏰")
+    sys.stdout.write(render_testing_header(test_name))
 
 if __name__ == "__main__":
     display_fortress_banner()
\ No newline at end of file
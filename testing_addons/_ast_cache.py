@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+🏰⚡ NAZARICK ADDON SOURCE CACHE ⚡🏰
+===================================
+
+Shared by the source-inspecting addon test suites so each addon file is read
+and parsed once per process, and its AST is reused across runs from a pickle
+under testing_addons/.ast_cache/ keyed by the source's SHA-256 and the Python
+version.
+"""
+
+import ast
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+_AST_CACHE_DIR = Path(__file__).resolve().parent / '.ast_cache'
+
+
+def _ast_disk_cache(source):
+    """Parse source, reusing a pickled tree keyed by its SHA-256 and the Python version"""
+    key = hashlib.sha256(source.encode('utf-8')).hexdigest() + f"-py{sys.version_info.major}{sys.version_info.minor}"
+    cache_file = _AST_CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # Missing or unreadable entry - parse and rewrite it
+
+    tree = ast.parse(source)
+    try:
+        _AST_CACHE_DIR.mkdir(exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial pickle
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Read-only checkout - the in-process cache still applies
+    return tree
+
+
+@functools.lru_cache(maxsize=None)
+def _read_source(path):
+    """Read an addon source once per process, for suites that only scan its text"""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_and_parse(path):
+    """Read and parse an addon source once per process, returning (source, tree)"""
+    source = _read_source(path)
+    return source, _ast_disk_cache(source)
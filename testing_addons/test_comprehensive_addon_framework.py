@@ -56,14 +56,18 @@ For the Eternal Glory of Nazarick! 🏰⚡🏰
 
 import sys
 import os
-import traceback
 import time
 import tempfile
 import json
 from typing import Dict, List, Tuple, Any, Optional, Callable
 from unittest.mock import Mock, patch, MagicMock
 from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 import logging
+import functools
+from collections import Counter, deque
+from operator import methodcaller
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Configure detailed logging for comprehensive test reporting
 logging.basicConfig(
@@ -73,9 +77,167 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Static banner rules, built once instead of on every log call
+_TITLE_RULE = "=" * 80
+_CATEGORY_RULE = "=" * 60
+_SUMMARY_RULE = "🏰" + "=" * 78 + "🏰"
+
+# Detail lines kept per category; older ones are dropped and counted
+_MAX_DETAILS = 256
+
+# Per-addon counters summed into the overall results by run_all_tests.
+# Interned explicitly so lookups stay pointer compares even if the keys are
+# ever built at runtime (e.g. loaded back from a JSON report).
+_AGGREGATE_KEYS = tuple(map(sys.intern, ('total_tests', 'passed_tests', 'failed_tests')))
+
 # Add src directory to path for addon imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# NumPy ships with Blender but may be missing from a bare CI interpreter
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional - Blender's bundled Python does not ship it, so fall back
+# to a pass-through decorator and run the kernel as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_stitch_placement(vert_count):
+    """Numeric proxy for placing stitches along ``vert_count`` vertices"""
+    total = 0.0
+    for i in range(vert_count):
+        total += (i * 0.001) ** 0.5
+    return total
+
+
+# Warm the JIT cache once at import so _test_performance never times compilation
+_simulate_stitch_placement(1)
+
+def _average_metric(metrics: Optional[Dict[str, float]]) -> float:
+    """Mean of a metrics dict, 0.0 when nothing was measured"""
+    return sum(metrics.values()) / len(metrics) if metrics else 0.0
+
+
+# (predicate, message) pairs evaluated in order by _generate_test_recommendations
+_RECOMMENDATION_RULES = (
+    (lambda r: r['success_rate'] < 100, "🔧 Address failing tests to improve addon reliability"),
+    (lambda r: bool(r.get('critical_issues')), "🚨 Critical issues found - immediate attention required"),
+    (lambda r: _average_metric(r.get('performance_metrics')) > 5.0, "⏱️  Consider performance optimizations"),
+    (lambda r: r['success_rate'] >= 95, "🏆 Excellent test coverage - addon ready for production"),
+)
+
+# Placeholder cases, each mapped to what it should test. They count as passed
+# without a call; to implement one, define the method in the framework class
+# and remove its name here.
+_STUB_TESTS = {
+    '_test_single_vertex_edge_case': "Test behavior with single vertex in group",
+    '_test_non_manifold_geometry': "Test behavior with non-manifold geometry",
+    '_test_empty_vertex_group': "Test behavior with empty vertex group",
+    '_test_tiny_mesh_scale': "Test behavior with extremely small mesh",
+    '_test_huge_mesh_scale': "Test behavior with extremely large mesh",
+    '_test_complex_topology': "Test behavior with complex mesh topology",
+    '_test_disconnected_vertices': "Test behavior with disconnected vertices in group",
+    '_test_zero_area_faces': "Test behavior with zero-area faces",
+    '_test_no_active_object': "Test behavior when no object is active",
+    '_test_wrong_object_type': "Test behavior with non-mesh object",
+    '_test_wrong_mode': "Test behavior when not in edit mode",
+    '_test_missing_vertex_groups': "Test behavior when vertex groups don't exist",
+    '_test_invalid_parameters': "Test behavior with invalid operator parameters",
+    '_test_memory_constraints': "Test behavior under memory pressure",
+    '_test_locked_mesh': "Test behavior when mesh data is locked",
+    '_test_interrupted_operations': "Test behavior when operations are interrupted",
+    '_test_stitch_count_boundary': "Test stitch count boundary",
+    '_test_stitch_size_boundary': "Test stitch size boundary",
+    '_test_depth_boundary': "Test depth boundary",
+    '_test_panel_visibility': "Test panel visibility conditions",
+    '_test_property_sync': "Test property synchronization between UI and operators",
+    '_test_button_functionality': "Test button click functionality",
+    '_test_memory_cleanup': "Test memory cleanup after operations",
+    '_test_temp_data_cleanup': "Test temporary data cleanup",
+    '_test_vertex_group_cleanup': "Test vertex group cleanup",
+    '_test_session_cleanup': "Test session tracking cleanup",
+    '_test_edit_to_object': "Test switching from edit to object mode",
+    '_test_object_to_edit': "Test switching from object to edit mode",
+    '_test_mode_validation': "Test mode validation logic",
+    '_test_mode_specific_ops': "Test mode-specific operations",
+    '_test_stitch_positioning': "Test accuracy of stitch positioning",
+    '_test_normal_calculations': "Test normal vector calculations",
+    '_test_edge_alignment': "Test edge alignment accuracy",
+    '_test_size_consistency': "Test size consistency across stitches",
+}
+
+
+def _case(case_name: str, method_name: str, *args) -> Tuple[str, Optional[Callable]]:
+    """Build a case-table entry, skipping the call for known stubs"""
+    if method_name in _STUB_TESTS:
+        return case_name, None
+    return case_name, methodcaller(method_name, *args)
+
+
+def _case_suite(cases, case_kind: Optional[str] = None):
+    """Turn a docstring-only method into a ``_run_case_table`` runner over ``cases``"""
+    def decorator(method):
+        @functools.wraps(method)
+        def runner(self) -> CaseResults:
+            return self._run_case_table(cases, case_kind)
+        return runner
+    return decorator
+
+
+_MISSING = object()
+_PANEL_REQUIRED_ATTRS = ('bl_label', 'draw')
+
+
+@functools.lru_cache(maxsize=None)
+def _panel_has_required(panel_class) -> bool:
+    """Check the panel attributes once per class without hasattr's exception path"""
+    return all(getattr(panel_class, attr, _MISSING) is not _MISSING for attr in _PANEL_REQUIRED_ATTRS)
+
+@dataclass(slots=True)
+class CaseResults:
+    """Pass/fail tally for one test category"""
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    details: deque = field(default_factory=lambda: deque(maxlen=_MAX_DETAILS))
+    details_truncated: int = 0
+    critical_issues: list = field(default_factory=list)
+    
+    def add_detail(self, detail: str):
+        """Record a detail line, keeping only the newest _MAX_DETAILS"""
+        if len(self.details) == _MAX_DETAILS:
+            self.details_truncated += 1
+        self.details.append(detail)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for JSON reports"""
+        report = {f.name: getattr(self, f.name) for f in fields(self)}
+        report['details'] = list(self.details)
+        return report
+
+
+@dataclass(slots=True)
+class WorkflowResults(CaseResults):
+    """Category tally that also keeps each simulated workflow result"""
+    workflows: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PerformanceResults(CaseResults):
+    """Category tally that also keeps per-test execution times"""
+    metrics: dict = field(default_factory=dict)
+    metrics_ns: dict = field(default_factory=dict)
+
+
 class BlenderTestEnvironment:
     """
     🎯 Core Blender Testing Environment
@@ -284,9 +446,13 @@ class StitchToolTestFramework:
         self.addon_module = None
         self.test_results = []
         self.performance_metrics = {}
+        # Detail strings are only read when debugging, so skip building them otherwise
+        self._collect_details = logger.isEnabledFor(logging.DEBUG)
         
         logger.info("🧵 Initializing Stitch Tool Test Framework...")
         self._load_addon()
+        # Resolved once so repeated UI sweeps skip the module attribute lookup
+        self._panel_cls = getattr(self.addon_module, 'VIEW3D_PT_NazarickStitchPanel', None)
     
     def _load_addon(self):
         """Load and validate the stitch tool addon"""
@@ -316,8 +482,7 @@ class StitchToolTestFramework:
             self._validate_addon_structure()
             
         except Exception as e:
-            logger.error(f"❌ Failed to load addon: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Failed to load addon: {e}")
             raise
     
     def _validate_addon_structure(self):
@@ -443,26 +608,27 @@ class StitchToolTestFramework:
             'recommendations': []
         }
         
+        log_info = logger.info
+        log_exception = logger.exception
         for category_name, test_method in test_categories:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"{category_name}")
-            logger.info(f"{'='*60}")
+            log_info(f"\n{_CATEGORY_RULE}")
+            log_info(f"{category_name}")
+            log_info(_CATEGORY_RULE)
             
             try:
                 category_results = test_method()
-                results['test_details'][category_name] = category_results
-                results['total_tests'] += category_results.get('total', 0)
-                results['passed_tests'] += category_results.get('passed', 0)
-                results['failed_tests'] += category_results.get('failed', 0)
+                results['test_details'][category_name] = category_results.to_dict()
+                results['total_tests'] += category_results.total
+                results['passed_tests'] += category_results.passed
+                results['failed_tests'] += category_results.failed
                 
-                if category_results.get('critical_issues'):
-                    results['critical_issues'].extend(category_results['critical_issues'])
+                if category_results.critical_issues:
+                    results['critical_issues'].extend(category_results.critical_issues)
                 
-                logger.info(f"✅ {category_name} completed: {category_results.get('passed', 0)}/{category_results.get('total', 0)} passed")
+                log_info(f"✅ {category_name} completed: {category_results.passed}/{category_results.total} passed")
                 
             except Exception as e:
-                logger.error(f"💥 {category_name} failed with exception: {e}")
-                logger.error(traceback.format_exc())
+                log_exception(f"💥 {category_name} failed with exception: {e}")
                 results['test_details'][category_name] = {
                     'total': 1,
                     'passed': 0,
@@ -485,12 +651,12 @@ class StitchToolTestFramework:
         
         return results
     
-    def _test_basic_functionality(self) -> Dict[str, Any]:
+    def _test_basic_functionality(self) -> CaseResults:
         """Test basic addon functionality and operator availability"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
+        results = CaseResults()
         
         # Test 1: Operator classes exist and are properly defined
-        results['total'] += 1
+        results.total += 1
         try:
             create_op = self.addon_module.MESH_OT_NazarickCreateStitches
             remove_op = self.addon_module.MESH_OT_NazarickRemoveStitches
@@ -502,17 +668,19 @@ class StitchToolTestFramework:
             assert hasattr(remove_op, 'bl_idname')
             assert hasattr(calc_op, 'bl_idname')
             
-            results['passed'] += 1
-            results['details'].append("✅ All operator classes properly defined")
+            results.passed += 1
+            if self._collect_details:
+                results.add_detail("✅ All operator classes properly defined")
             logger.info("✅ Operator classes validation passed")
             
         except Exception as e:
-            results['failed'] += 1
-            results['details'].append(f"❌ Operator validation failed: {e}")
+            results.failed += 1
+            if self._collect_details:
+                results.add_detail(f"❌ Operator validation failed: {e}")
             logger.error(f"❌ Operator validation failed: {e}")
         
         # Test 2: Panel class exists and is properly structured
-        results['total'] += 1
+        results.total += 1
         try:
             panel_class = self.addon_module.VIEW3D_PT_NazarickStitchPanel
             
@@ -522,17 +690,19 @@ class StitchToolTestFramework:
             assert hasattr(panel_class, 'draw')
             assert hasattr(panel_class, 'poll')
             
-            results['passed'] += 1
-            results['details'].append("✅ Panel class properly structured")
+            results.passed += 1
+            if self._collect_details:
+                results.add_detail("✅ Panel class properly structured")
             logger.info("✅ Panel class validation passed")
             
         except Exception as e:
-            results['failed'] += 1
-            results['details'].append(f"❌ Panel validation failed: {e}")
+            results.failed += 1
+            if self._collect_details:
+                results.add_detail(f"❌ Panel validation failed: {e}")
             logger.error(f"❌ Panel validation failed: {e}")
         
         # Test 3: StitchGeometryManager functionality
-        results['total'] += 1
+        results.total += 1
         try:
             manager = self.addon_module.StitchGeometryManager
             
@@ -541,25 +711,27 @@ class StitchToolTestFramework:
             assert isinstance(session_id, str)
             assert 'stitch_' in session_id
             
-            results['passed'] += 1
-            results['details'].append("✅ StitchGeometryManager functional")
+            results.passed += 1
+            if self._collect_details:
+                results.add_detail("✅ StitchGeometryManager functional")
             logger.info("✅ StitchGeometryManager validation passed")
             
         except Exception as e:
-            results['failed'] += 1
-            results['details'].append(f"❌ StitchGeometryManager validation failed: {e}")
+            results.failed += 1
+            if self._collect_details:
+                results.add_detail(f"❌ StitchGeometryManager validation failed: {e}")
             logger.error(f"❌ StitchGeometryManager validation failed: {e}")
         
         return results
     
-    def _test_user_workflows(self) -> Dict[str, Any]:
+    def _test_user_workflows(self) -> WorkflowResults:
         """
         🎯 Simulate realistic user workflows
         
         CRITICAL: This type of workflow testing MUST be implemented for every addon.
         Test the complete user journey, not just individual functions.
         """
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': [], 'workflows': []}
+        results = WorkflowResults()
         
         workflows = [
             "🧵 Basic Stitch Creation Workflow",
@@ -569,27 +741,32 @@ class StitchToolTestFramework:
             "📐 Multi-group Stitch Workflow"
         ]
         
+        log_info = logger.info
+        log_error = logger.error
         for workflow_name in workflows:
-            results['total'] += 1
-            logger.info(f"🎬 Simulating: {workflow_name}")
+            results.total += 1
+            log_info(f"🎬 Simulating: {workflow_name}")
             
             try:
                 workflow_result = self._simulate_workflow(workflow_name)
                 if workflow_result['success']:
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {workflow_name} completed successfully")
-                    logger.info(f"✅ {workflow_name} passed")
+                    results.passed += 1
+                    if self._collect_details:
+                        results.add_detail(f"✅ {workflow_name} completed successfully")
+                    log_info(f"✅ {workflow_name} passed")
                 else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {workflow_name} failed: {workflow_result['error']}")
-                    logger.error(f"❌ {workflow_name} failed: {workflow_result['error']}")
+                    results.failed += 1
+                    if self._collect_details:
+                        results.add_detail(f"❌ {workflow_name} failed: {workflow_result['error']}")
+                    log_error(f"❌ {workflow_name} failed: {workflow_result['error']}")
                 
-                results['workflows'].append(workflow_result)
+                results.workflows.append(workflow_result)
                 
             except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {workflow_name} exception: {e}")
-                logger.error(f"💥 {workflow_name} exception: {e}")
+                results.failed += 1
+                if self._collect_details:
+                    results.add_detail(f"💥 {workflow_name} exception: {e}")
+                log_error(f"💥 {workflow_name} exception: {e}")
         
         return results
     
@@ -716,194 +893,101 @@ class StitchToolTestFramework:
             ]
         }
     
-    def _test_edge_cases(self) -> Dict[str, Any]:
+    def _run_case_table(self, cases, case_kind: Optional[str] = None) -> CaseResults:
         """
-        ⚠️  Test edge cases and boundary conditions
+        Run a table of ``(case_name, test_func)`` pairs and tally the outcomes
         
-        CRITICAL FOR FUTURE ADDONS: This comprehensive edge case testing
-        is MANDATORY for every addon to ensure robustness.
-        """
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        edge_cases = [
-            ("🔺 Single vertex group", self._test_single_vertex_edge_case),
-            ("📐 Non-manifold geometry", self._test_non_manifold_geometry),
-            ("🔄 Empty vertex group", self._test_empty_vertex_group),
-            ("📏 Extremely small mesh", self._test_tiny_mesh_scale),
-            ("🗻 Extremely large mesh", self._test_huge_mesh_scale),
-            ("🧩 Complex topology", self._test_complex_topology),
-            ("🔀 Disconnected vertices", self._test_disconnected_vertices),
-            ("📊 Zero-area faces", self._test_zero_area_faces)
-        ]
+        ``test_func`` is called with the framework instance, so class-level
+        tables can hold ``operator.methodcaller`` entries. A ``None`` entry
+        marks a stub listed in ``_STUB_TESTS`` and counts as passed.
         
-        for case_name, test_func in edge_cases:
-            results['total'] += 1
-            logger.info(f"🧪 Testing edge case: {case_name}")
+        Detail strings are only recorded when debug logging is enabled.
+        """
+        results = CaseResults()
+        add_detail = results.add_detail
+        log_info = logger.info
+        log_error = logger.error
+        
+        for case_name, test_func in cases:
+            results.total += 1
+            if case_kind:
+                log_info(f"🧪 Testing {case_kind}: {case_name}")
             
             try:
-                case_result = test_func()
-                if case_result:
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {case_name} handled correctly")
+                # Stub cases are known to pass, so skip the call entirely
+                if test_func is None or test_func(self):
+                    results.passed += 1
+                    if self._collect_details:
+                        add_detail(f"✅ {case_name}")
                 else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {case_name} not handled properly")
+                    results.failed += 1
+                    if self._collect_details:
+                        add_detail(f"❌ {case_name}")
                     
             except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {case_name} caused exception: {e}")
-                logger.error(f"💥 {case_name} exception: {e}")
+                results.failed += 1
+                if self._collect_details:
+                    add_detail(f"💥 {case_name}: {e}")
+                log_error(f"💥 {case_name} exception: {e}")
         
         return results
     
-    def _test_single_vertex_edge_case(self) -> bool:
-        """Test behavior with single vertex in group"""
-        # Test that single vertex group is handled gracefully
-        return True  # Simplified for framework demo
-    
-    def _test_non_manifold_geometry(self) -> bool:
-        """Test behavior with non-manifold geometry"""
-        return True
-    
-    def _test_empty_vertex_group(self) -> bool:
-        """Test behavior with empty vertex group"""
-        return True
-    
-    def _test_tiny_mesh_scale(self) -> bool:
-        """Test behavior with extremely small mesh"""
-        return True
-    
-    def _test_huge_mesh_scale(self) -> bool:
-        """Test behavior with extremely large mesh"""  
-        return True
-    
-    def _test_complex_topology(self) -> bool:
-        """Test behavior with complex mesh topology"""
-        return True
-    
-    def _test_disconnected_vertices(self) -> bool:
-        """Test behavior with disconnected vertices in group"""
-        return True
-    
-    def _test_zero_area_faces(self) -> bool:
-        """Test behavior with zero-area faces"""
-        return True
+    _EDGE_CASES: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("🔺 Single vertex group", '_test_single_vertex_edge_case'),
+        _case("📐 Non-manifold geometry", '_test_non_manifold_geometry'),
+        _case("🔄 Empty vertex group", '_test_empty_vertex_group'),
+        _case("📏 Extremely small mesh", '_test_tiny_mesh_scale'),
+        _case("🗻 Extremely large mesh", '_test_huge_mesh_scale'),
+        _case("🧩 Complex topology", '_test_complex_topology'),
+        _case("🔀 Disconnected vertices", '_test_disconnected_vertices'),
+        _case("📊 Zero-area faces", '_test_zero_area_faces')
+    )
+    
+    @_case_suite(_EDGE_CASES, "edge case")
+    def _test_edge_cases(self) -> CaseResults:
+        """
+        ⚠️  Test edge cases and boundary conditions
+        
+        CRITICAL FOR FUTURE ADDONS: This comprehensive edge case testing
+        is MANDATORY for every addon to ensure robustness.
+        """
     
-    def _test_error_conditions(self) -> Dict[str, Any]:
+    _ERROR_CONDITIONS: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("❌ No active object", '_test_no_active_object'),
+        _case("🚫 Wrong object type", '_test_wrong_object_type'),
+        _case("⚠️  Object mode instead of edit", '_test_wrong_mode'),
+        _case("📭 Missing vertex groups", '_test_missing_vertex_groups'),
+        _case("🚫 Invalid parameters", '_test_invalid_parameters'),
+        _case("💾 Memory constraints", '_test_memory_constraints'),
+        _case("🔐 Locked mesh data", '_test_locked_mesh'),
+        _case("⚡ Interrupted operations", '_test_interrupted_operations')
+    )
+    
+    @_case_suite(_ERROR_CONDITIONS, "error condition")
+    def _test_error_conditions(self) -> CaseResults:
         """
         💥 Test error conditions and failure modes
         
         ESSENTIAL FOR ALL ADDONS: Every possible failure mode must be tested
         to ensure graceful degradation and proper error reporting.
         """
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        error_conditions = [
-            ("❌ No active object", self._test_no_active_object),
-            ("🚫 Wrong object type", self._test_wrong_object_type),
-            ("⚠️  Object mode instead of edit", self._test_wrong_mode),
-            ("📭 Missing vertex groups", self._test_missing_vertex_groups),
-            ("🚫 Invalid parameters", self._test_invalid_parameters),
-            ("💾 Memory constraints", self._test_memory_constraints),
-            ("🔐 Locked mesh data", self._test_locked_mesh),
-            ("⚡ Interrupted operations", self._test_interrupted_operations)
-        ]
-        
-        for condition_name, test_func in error_conditions:
-            results['total'] += 1
-            logger.info(f"🧪 Testing error condition: {condition_name}")
-            
-            try:
-                handled_gracefully = test_func()
-                if handled_gracefully:
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {condition_name} handled gracefully")
-                else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {condition_name} not handled properly")
-                    
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {condition_name} caused unhandled exception: {e}")
-        
-        return results
-    
-    def _test_no_active_object(self) -> bool:
-        """Test behavior when no object is active"""
-        return True  # Simplified implementation
     
-    def _test_wrong_object_type(self) -> bool:
-        """Test behavior with non-mesh object"""
-        return True
-    
-    def _test_wrong_mode(self) -> bool:
-        """Test behavior when not in edit mode"""
-        return True
-    
-    def _test_missing_vertex_groups(self) -> bool:
-        """Test behavior when vertex groups don't exist"""
-        return True
-    
-    def _test_invalid_parameters(self) -> bool:
-        """Test behavior with invalid operator parameters"""
-        return True
-    
-    def _test_memory_constraints(self) -> bool:
-        """Test behavior under memory pressure"""
-        return True
-    
-    def _test_locked_mesh(self) -> bool:
-        """Test behavior when mesh data is locked"""
-        return True
-    
-    def _test_interrupted_operations(self) -> bool:
-        """Test behavior when operations are interrupted"""
-        return True
-    
-    def _test_parameter_boundaries(self) -> Dict[str, Any]:
+    _BOUNDARY_TESTS: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("Stitch count: minimum (1)", '_test_stitch_count_boundary', 1),
+        _case("Stitch count: maximum (1000)", '_test_stitch_count_boundary', 1000),
+        _case("Stitch size: minimum (0.001)", '_test_stitch_size_boundary', 0.001),
+        _case("Stitch size: maximum (10.0)", '_test_stitch_size_boundary', 10.0),
+        _case("Depth: zero", '_test_depth_boundary', 0.0),
+        _case("Depth: maximum", '_test_depth_boundary', 5.0)
+    )
+    
+    @_case_suite(_BOUNDARY_TESTS)
+    def _test_parameter_boundaries(self) -> CaseResults:
         """Test parameter boundary conditions"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        # Test various parameter combinations at boundaries
-        boundary_tests = [
-            ("Stitch count: minimum (1)", lambda: self._test_stitch_count_boundary(1)),
-            ("Stitch count: maximum (1000)", lambda: self._test_stitch_count_boundary(1000)),
-            ("Stitch size: minimum (0.001)", lambda: self._test_stitch_size_boundary(0.001)),
-            ("Stitch size: maximum (10.0)", lambda: self._test_stitch_size_boundary(10.0)),
-            ("Depth: zero", lambda: self._test_depth_boundary(0.0)),
-            ("Depth: maximum", lambda: self._test_depth_boundary(5.0))
-        ]
-        
-        for test_name, test_func in boundary_tests:
-            results['total'] += 1
-            try:
-                if test_func():
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {test_name}")
-                else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {test_name}")
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {test_name}: {e}")
-        
-        return results
-    
-    def _test_stitch_count_boundary(self, count: int) -> bool:
-        """Test stitch count boundary"""
-        return True
     
-    def _test_stitch_size_boundary(self, size: float) -> bool:
-        """Test stitch size boundary"""
-        return True
-    
-    def _test_depth_boundary(self, depth: float) -> bool:
-        """Test depth boundary"""
-        return True
-    
-    def _test_performance(self) -> Dict[str, Any]:
+    def _test_performance(self) -> PerformanceResults:
         """Test performance with various mesh sizes and configurations"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': [], 'metrics': {}}
+        results = PerformanceResults()
         
         performance_tests = [
             ("Small mesh (< 100 verts)", 100),
@@ -911,226 +995,95 @@ class StitchToolTestFramework:
             ("Large mesh (10000 verts)", 10000)
         ]
         
+        log_info = logger.info
         for test_name, vert_count in performance_tests:
-            results['total'] += 1
-            logger.info(f"⏱️  Performance test: {test_name}")
+            results.total += 1
+            log_info(f"⏱️  Performance test: {test_name}")
             
             try:
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 success = self._performance_test_with_vert_count(vert_count)
-                execution_time = time.time() - start_time
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                execution_time = elapsed_ns * 1e-9
                 
-                results['metrics'][test_name] = execution_time
+                results.metrics[test_name] = execution_time
+                results.metrics_ns[test_name] = elapsed_ns
                 
                 if success and execution_time < 30.0:  # 30 second limit
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {test_name}: {execution_time:.2f}s")
+                    results.passed += 1
+                    if self._collect_details:
+                        results.add_detail(f"✅ {test_name}: {execution_time:.2f}s")
                 else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {test_name}: {execution_time:.2f}s (too slow or failed)")
+                    results.failed += 1
+                    if self._collect_details:
+                        results.add_detail(f"❌ {test_name}: {execution_time:.2f}s (too slow or failed)")
                     
             except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {test_name}: {e}")
+                results.failed += 1
+                if self._collect_details:
+                    results.add_detail(f"💥 {test_name}: {e}")
         
         return results
     
     def _performance_test_with_vert_count(self, vert_count: int) -> bool:
         """Simulate performance test with given vertex count"""
         # Simulate mesh operations based on vertex count
-        time.sleep(max(0.01, vert_count / 100000))  # Simulate processing time
-        return True
-    
-    def _test_ui_integration(self) -> Dict[str, Any]:
+        placement = _simulate_stitch_placement(vert_count)
+        return placement >= 0.0
+    
+    _UI_TESTS: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("Panel registration", '_test_panel_registration'),
+        _case("Panel visibility", '_test_panel_visibility'),
+        _case("Property synchronization", '_test_property_sync'),
+        _case("Button functionality", '_test_button_functionality')
+    )
+    
+    @_case_suite(_UI_TESTS)
+    def _test_ui_integration(self) -> CaseResults:
         """Test UI panel integration and functionality"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        ui_tests = [
-            ("Panel registration", self._test_panel_registration),
-            ("Panel visibility", self._test_panel_visibility),
-            ("Property synchronization", self._test_property_sync),
-            ("Button functionality", self._test_button_functionality)
-        ]
-        
-        for test_name, test_func in ui_tests:
-            results['total'] += 1
-            try:
-                if test_func():
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {test_name}")
-                else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {test_name}")
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {test_name}: {e}")
-        
-        return results
     
     def _test_panel_registration(self) -> bool:
         """Test that panel registers correctly"""
-        panel_class = self.addon_module.VIEW3D_PT_NazarickStitchPanel
-        return hasattr(panel_class, 'bl_label') and hasattr(panel_class, 'draw')
-    
-    def _test_panel_visibility(self) -> bool:
-        """Test panel visibility conditions"""
-        return True
+        return _panel_has_required(self._panel_cls)
     
-    def _test_property_sync(self) -> bool:
-        """Test property synchronization between UI and operators"""
-        return True
+    _CLEANUP_TESTS: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("Memory cleanup", '_test_memory_cleanup'),
+        _case("Temporary data removal", '_test_temp_data_cleanup'),
+        _case("Vertex group cleanup", '_test_vertex_group_cleanup'),
+        _case("Session tracking cleanup", '_test_session_cleanup')
+    )
     
-    def _test_button_functionality(self) -> bool:
-        """Test button click functionality"""
-        return True
-    
-    def _test_cleanup_and_resources(self) -> Dict[str, Any]:
+    @_case_suite(_CLEANUP_TESTS)
+    def _test_cleanup_and_resources(self) -> CaseResults:
         """Test cleanup and resource management"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        cleanup_tests = [
-            ("Memory cleanup", self._test_memory_cleanup),
-            ("Temporary data removal", self._test_temp_data_cleanup),
-            ("Vertex group cleanup", self._test_vertex_group_cleanup),
-            ("Session tracking cleanup", self._test_session_cleanup)
-        ]
-        
-        for test_name, test_func in cleanup_tests:
-            results['total'] += 1
-            try:
-                if test_func():
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {test_name}")
-                else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {test_name}")
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {test_name}: {e}")
-        
-        return results
-    
-    def _test_memory_cleanup(self) -> bool:
-        """Test memory cleanup after operations"""
-        return True
-    
-    def _test_temp_data_cleanup(self) -> bool:
-        """Test temporary data cleanup"""
-        return True
     
-    def _test_vertex_group_cleanup(self) -> bool:
-        """Test vertex group cleanup"""
-        return True
+    _MODE_TESTS: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("Edit to Object mode", '_test_edit_to_object'),
+        _case("Object to Edit mode", '_test_object_to_edit'),
+        _case("Mode validation", '_test_mode_validation'),
+        _case("Mode-specific operations", '_test_mode_specific_ops')
+    )
     
-    def _test_session_cleanup(self) -> bool:
-        """Test session tracking cleanup"""
-        return True
-    
-    def _test_mode_switching(self) -> Dict[str, Any]:
+    @_case_suite(_MODE_TESTS)
+    def _test_mode_switching(self) -> CaseResults:
         """Test robustness of mode switching"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        mode_tests = [
-            ("Edit to Object mode", self._test_edit_to_object),
-            ("Object to Edit mode", self._test_object_to_edit), 
-            ("Mode validation", self._test_mode_validation),
-            ("Mode-specific operations", self._test_mode_specific_ops)
-        ]
-        
-        for test_name, test_func in mode_tests:
-            results['total'] += 1
-            try:
-                if test_func():
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {test_name}")
-                else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {test_name}")
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {test_name}: {e}")
-        
-        return results
-    
-    def _test_edit_to_object(self) -> bool:
-        """Test switching from edit to object mode"""
-        return True
     
-    def _test_object_to_edit(self) -> bool:
-        """Test switching from object to edit mode"""
-        return True
+    _GEOMETRY_TESTS: Tuple[Tuple[str, Optional[Callable]], ...] = (
+        _case("Stitch positioning accuracy", '_test_stitch_positioning'),
+        _case("Normal calculations", '_test_normal_calculations'),
+        _case("Edge alignment", '_test_edge_alignment'),
+        _case("Size consistency", '_test_size_consistency')
+    )
     
-    def _test_mode_validation(self) -> bool:
-        """Test mode validation logic"""
-        return True
-    
-    def _test_mode_specific_ops(self) -> bool:
-        """Test mode-specific operations"""
-        return True
-    
-    def _test_geometric_accuracy(self) -> Dict[str, Any]:
+    @_case_suite(_GEOMETRY_TESTS)
+    def _test_geometric_accuracy(self) -> CaseResults:
         """Test geometric accuracy of stitch creation"""
-        results = {'total': 0, 'passed': 0, 'failed': 0, 'details': []}
-        
-        geometry_tests = [
-            ("Stitch positioning accuracy", self._test_stitch_positioning),
-            ("Normal calculations", self._test_normal_calculations),
-            ("Edge alignment", self._test_edge_alignment),
-            ("Size consistency", self._test_size_consistency)
-        ]
-        
-        for test_name, test_func in geometry_tests:
-            results['total'] += 1
-            try:
-                if test_func():
-                    results['passed'] += 1
-                    results['details'].append(f"✅ {test_name}")
-                else:
-                    results['failed'] += 1
-                    results['details'].append(f"❌ {test_name}")
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append(f"💥 {test_name}: {e}")
-        
-        return results
-    
-    def _test_stitch_positioning(self) -> bool:
-        """Test accuracy of stitch positioning"""
-        return True
-    
-    def _test_normal_calculations(self) -> bool:
-        """Test normal vector calculations"""
-        return True
-    
-    def _test_edge_alignment(self) -> bool:
-        """Test edge alignment accuracy"""
-        return True
-    
-    def _test_size_consistency(self) -> bool:
-        """Test size consistency across stitches"""
-        return True
     
     def _generate_test_recommendations(self, results: Dict[str, Any]):
         """Generate recommendations based on test results"""
-        recommendations = []
-        
-        if results['success_rate'] < 100:
-            recommendations.append("🔧 Address failing tests to improve addon reliability")
-        
-        if results.get('critical_issues'):
-            recommendations.append("🚨 Critical issues found - immediate attention required")
-        
-        # Performance recommendations
-        perf_metrics = results.get('performance_metrics', {})
-        if perf_metrics:
-            avg_time = sum(perf_metrics.values()) / len(perf_metrics)
-            if avg_time > 5.0:
-                recommendations.append("⏱️  Consider performance optimizations")
-        
-        if results['success_rate'] >= 95:
-            recommendations.append("🏆 Excellent test coverage - addon ready for production")
-        
-        results['recommendations'] = recommendations
+        results['recommendations'] = [
+            message for applies, message in _RECOMMENDATION_RULES if applies(results)
+        ]
 
 
 class ExtensibleTestFramework:
@@ -1159,8 +1112,22 @@ class ExtensibleTestFramework:
         self.registered_test_suites[addon_name] = test_suite
         logger.info(f"✅ Registered test suite for {addon_name}")
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run tests for all registered addons"""
+    def run_all_tests(self, parallel: Optional[str] = None, fail_fast: bool = False) -> Dict[str, Any]:
+        """
+        Run tests for all registered addons
+        
+        ``parallel`` selects how independent addon suites are scheduled:
+        ``None`` runs them one after another, ``'thread'`` uses a thread pool
+        and ``'process'`` gives every suite its own interpreter so CPU-heavy
+        suites scale past the GIL. Process workers rebuild their suite from
+        its class, since live addon modules and mocks cannot be pickled.
+        
+        With ``fail_fast`` the run stops at the first addon reporting failed
+        tests; suites that have not started yet are skipped.
+        """
+        if parallel not in (None, 'thread', 'process'):
+            raise ValueError(f"Unknown parallel mode: {parallel!r}")
+        
         overall_results = {
             'addons_tested': 0,
             'total_tests': 0,
@@ -1169,27 +1136,55 @@ class ExtensibleTestFramework:
             'addon_results': {}
         }
         
-        for addon_name, test_suite in self.registered_test_suites.items():
-            logger.info(f"🧪 Testing addon: {addon_name}")
+        log_info = logger.info
+        if parallel is None:
+            for addon_name, test_suite in self.registered_test_suites.items():
+                log_info(f"🧪 Testing addon: {addon_name}")
+                addon_results = self._record_addon_results(
+                    overall_results, addon_name, test_suite.run_comprehensive_tests
+                )
+                if fail_fast and addon_results.get('failed_tests', 0):
+                    logger.warning(f"⛔ Fail-fast: stopping after failures in {addon_name}")
+                    break
+        else:
+            if parallel == 'process':
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            else:
+                executor = ThreadPoolExecutor(max_workers=os.cpu_count())
             
-            try:
-                addon_results = test_suite.run_comprehensive_tests()
-                
-                overall_results['addon_results'][addon_name] = addon_results
-                overall_results['addons_tested'] += 1
-                overall_results['total_tests'] += addon_results['total_tests']
-                overall_results['passed_tests'] += addon_results['passed_tests']
-                overall_results['failed_tests'] += addon_results['failed_tests']
+            with executor:
+                futures = []
+                for addon_name, test_suite in self.registered_test_suites.items():
+                    log_info(f"🧪 Testing addon: {addon_name}")
+                    if parallel == 'process':
+                        future = executor.submit(
+                            _run_suite_in_worker, type(test_suite), self.test_env.use_real_blender
+                        )
+                    else:
+                        future = executor.submit(test_suite.run_comprehensive_tests)
+                    futures.append((addon_name, future))
                 
-            except Exception as e:
-                logger.error(f"💥 Failed to test {addon_name}: {e}")
-                overall_results['addon_results'][addon_name] = {
-                    'error': str(e),
-                    'total_tests': 0,
-                    'passed_tests': 0,
-                    'failed_tests': 1
-                }
-                overall_results['failed_tests'] += 1
+                for index, (addon_name, future) in enumerate(futures):
+                    addon_results = self._record_addon_results(overall_results, addon_name, future.result)
+                    if fail_fast and addon_results.get('failed_tests', 0):
+                        logger.warning(f"⛔ Fail-fast: stopping after failures in {addon_name}")
+                        for _, pending in futures[index + 1:]:
+                            pending.cancel()
+                        break
+        
+        # Aggregate counters in one pass over the collected addon results
+        addon_results_list = list(overall_results['addon_results'].values())
+        if np is not None and addon_results_list:
+            counts = np.array(
+                [[r[key] for key in _AGGREGATE_KEYS] for r in addon_results_list],
+                dtype=np.int64
+            )
+            overall_results.update(zip(_AGGREGATE_KEYS, counts.sum(axis=0).tolist()))
+        else:
+            totals = Counter()
+            for addon_results in addon_results_list:
+                totals.update({key: addon_results[key] for key in _AGGREGATE_KEYS})
+            overall_results.update(totals)
         
         # Calculate success rate
         if overall_results['total_tests'] > 0:
@@ -1198,6 +1193,31 @@ class ExtensibleTestFramework:
             overall_results['success_rate'] = 0
         
         return overall_results
+    
+    def _record_addon_results(self, overall_results: Dict[str, Any], addon_name: str,
+                              get_results: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Store one addon's results, recording a failure if its suite raised"""
+        try:
+            addon_results = get_results()
+            overall_results['addons_tested'] += 1
+            
+        except Exception as e:
+            logger.error(f"💥 Failed to test {addon_name}: {e}")
+            addon_results = {
+                'error': str(e),
+                'total_tests': 0,
+                'passed_tests': 0,
+                'failed_tests': 1
+            }
+        
+        overall_results['addon_results'][addon_name] = addon_results
+        return addon_results
+
+
+def _run_suite_in_worker(suite_class, use_real_blender: bool) -> Dict[str, Any]:
+    """Build and run an addon suite inside a process-pool worker"""
+    test_env = BlenderTestEnvironment(use_real_blender=use_real_blender)
+    return suite_class(test_env).run_comprehensive_tests()
 
 
 def main():
@@ -1207,11 +1227,12 @@ def main():
     This demonstrates the complete testing workflow that should be
     implemented for every Blender addon in the Nazarick Fortress.
     """
-    logger.info("🏰⚡ NAZARICK COMPREHENSIVE ADDON TESTING FRAMEWORK ⚡🏰")
-    logger.info("=" * 80)
-    logger.info("Supreme Overlord's Automated Testing Framework")
-    logger.info("For the Eternal Glory of Nazarick! 🏰")
-    logger.info("=" * 80)
+    log_info = logger.info
+    log_info("🏰⚡ NAZARICK COMPREHENSIVE ADDON TESTING FRAMEWORK ⚡🏰")
+    log_info(_TITLE_RULE)
+    log_info("Supreme Overlord's Automated Testing Framework")
+    log_info("For the Eternal Glory of Nazarick! 🏰")
+    log_info(_TITLE_RULE)
     
     try:
         # Initialize test environment
@@ -1225,49 +1246,57 @@ def main():
         addon_framework.register_addon_test("Stitch Tool", stitch_framework)
         
         # Run comprehensive tests
-        logger.info("🚀 Executing comprehensive addon test suite...")
-        results = addon_framework.run_all_tests()
-        
-        # Display results
-        logger.info("\n" + "🏰" + "=" * 78 + "🏰")
-        logger.info("⚡ SUPREME OVERLORD'S TESTING SUMMARY ⚡")
-        logger.info("🏰" + "=" * 78 + "🏰")
-        
-        logger.info(f"📊 Total Tests Executed: {results['total_tests']}")
-        logger.info(f"✅ Tests Passed: {results['passed_tests']}")
-        logger.info(f"❌ Tests Failed: {results['failed_tests']}")
-        logger.info(f"🎯 Success Rate: {results['success_rate']:.1f}%")
-        logger.info(f"⏱️  Execution Time: {results.get('execution_time', 0):.2f}s")
+        log_info("🚀 Executing comprehensive addon test suite...")
+        fail_fast = os.environ.get('NAZARICK_FAIL_FAST') == '1'
+        results = addon_framework.run_all_tests(fail_fast=fail_fast)
+        
+        # Display results as a single log record instead of one per line
+        lines = [
+            f"\n{_SUMMARY_RULE}",
+            "⚡ SUPREME OVERLORD'S TESTING SUMMARY ⚡",
+            _SUMMARY_RULE,
+            f"📊 Total Tests Executed: {results['total_tests']}",
+            f"✅ Tests Passed: {results['passed_tests']}",
+            f"❌ Tests Failed: {results['failed_tests']}",
+            f"🎯 Success Rate: {results['success_rate']:.1f}%",
+            f"⏱️  Execution Time: {results.get('execution_time', 0):.2f}s",
+        ]
         
         if results.get('critical_issues'):
-            logger.info("\n🚨 CRITICAL ISSUES IDENTIFIED:")
-            for issue in results['critical_issues']:
-                logger.info(f"   ⚠️  {issue}")
+            lines.append("\n🚨 CRITICAL ISSUES IDENTIFIED:")
+            lines.extend(f"   ⚠️  {issue}" for issue in results['critical_issues'])
         
         if results.get('recommendations'):
-            logger.info("\n💡 RECOMMENDATIONS:")
-            for rec in results['recommendations']:
-                logger.info(f"   🔧 {rec}")
+            lines.append("\n💡 RECOMMENDATIONS:")
+            lines.extend(f"   🔧 {rec}" for rec in results['recommendations'])
         
         # Determine overall status
         if results['success_rate'] >= 95:
-            logger.info("\n🏆 FORTRESS STATUS: SUPREMELY OPERATIONAL ⚡")
-            logger.info("🎉 All tested addons meet the Supreme Overlord's standards!")
-            logger.info("🚀 Ready for production deployment in Blender 4.5+")
-            logger.info("\n🏰 FOR THE ETERNAL GLORY OF NAZARICK! ⚡🏰")
-            return True
+            lines.extend((
+                "\n🏆 FORTRESS STATUS: SUPREMELY OPERATIONAL ⚡",
+                "🎉 All tested addons meet the Supreme Overlord's standards!",
+                "🚀 Ready for production deployment in Blender 4.5+",
+                "\n🏰 FOR THE ETERNAL GLORY OF NAZARICK! ⚡🏰",
+            ))
+            success = True
         elif results['success_rate'] >= 80:
-            logger.info("\n⚠️  FORTRESS STATUS: OPERATIONAL WITH CONCERNS")
-            logger.info("🔧 Most tests passed, but some addons require attention")
-            return False
+            lines.extend((
+                "\n⚠️  FORTRESS STATUS: OPERATIONAL WITH CONCERNS",
+                "🔧 Most tests passed, but some addons require attention",
+            ))
+            success = False
         else:
-            logger.info("\n🚨 FORTRESS STATUS: REQUIRES IMMEDIATE ATTENTION")
-            logger.info("💥 Critical issues found in addon testing - deployment not recommended")
-            return False
+            lines.extend((
+                "\n🚨 FORTRESS STATUS: REQUIRES IMMEDIATE ATTENTION",
+                "💥 Critical issues found in addon testing - deployment not recommended",
+            ))
+            success = False
+        
+        log_info("\n".join(lines))
+        return success
     
     except Exception as e:
-        logger.error(f"💥 Testing framework failure: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"💥 Testing framework failure: {e}")
         return False
 
 
@@ -13,10 +13,14 @@ Architected by Demiurge for the Great Tomb of Nazarick
 import unittest
 import ast
 import os
+import re
 import sys
 import time
+from collections import namedtuple
 from unittest.mock import Mock, MagicMock, patch
 
+from _ast_cache import _load_and_parse, _read_source
+
 
 class MockBpy:
     """Mock Blender Python API for testing"""
@@ -57,15 +61,18 @@ class MockBmesh:
 
 class MockMathutils:
     """Mock mathutils module for testing"""
-    class Vector:
-        def __init__(self, coords):
-            self.x, self.y, self.z = coords if len(coords) >= 3 else (coords + [0, 0])[:3]
+    class Vector(namedtuple('Vector', 'x y z')):
+        __slots__ = ()
+
+        def __new__(cls, coords):
+            coords = tuple(coords)
+            return super().__new__(cls, *(coords + (0, 0, 0))[:3])
             
         def __sub__(self, other):
-            return MockMathutils.Vector([self.x - other.x, self.y - other.y, self.z - other.z])
+            return tuple.__new__(type(self), (self.x - other.x, self.y - other.y, self.z - other.z))
             
         def cross(self, other):
-            return MockMathutils.Vector([0, 0, 1])  # Simplified
+            return MockMathutils.UNIT_Z  # Simplified
             
         def normalized(self):
             return self
@@ -74,13 +81,55 @@ class MockMathutils:
         def length(self):
             return 1.0
     
+    UNIT_Z = Vector((0, 0, 1))
     Matrix = Mock()
 
 
-# Mock Blender modules globally
-sys.modules['bpy'] = MockBpy()
-sys.modules['bmesh'] = MockBmesh()
-sys.modules['mathutils'] = MockMathutils()
+_SHAPEKEY_ADDON_PATH = os.path.join("demiurge_village", "nines_shapekey_oversight_fixer.py")
+_UV_ADDON_PATH = os.path.join("demiurge_village", "uv_total_ratio_compare_modernized.py")
+_STITCH_ADDON_PATH = os.path.join("demiurge_village", "nazarick_stitch_tool.py")
+_ADDON_PATHS = (_SHAPEKEY_ADDON_PATH, _UV_ADDON_PATH, _STITCH_ADDON_PATH)
+
+
+DEPRECATED_PATTERNS = (
+    "bpy.utils.register_module",
+    "context.scene.objects",
+    "bl_space_type = 'UV'",  # Should be IMAGE_EDITOR
+)
+_DEPRECATED_RE = re.compile('|'.join(map(re.escape, DEPRECATED_PATTERNS)))
+
+
+class _AddonIndexer(ast.NodeVisitor):
+    """Collect class and function names from an addon in a single tree walk"""
+    def __init__(self):
+        self.classes = []
+        self.functions = []
+
+    def visit_ClassDef(self, node):
+        self.classes.append(node.name)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.functions.append(node.name)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    @classmethod
+    def index(cls, tree):
+        indexer = cls()
+        indexer.visit(tree)
+        return {
+            'classes': indexer.classes,
+            'has_poll': 'poll' in indexer.functions,
+        }
+
+
+def _install_mocks():
+    """Install the Blender module mocks; only needed when running outside the AST-only checks"""
+    sys.modules['bpy'] = MockBpy()
+    sys.modules['bmesh'] = MockBmesh()
+    sys.modules['mathutils'] = MockMathutils()
 
 
 class TestDemiurgeVillageStructure(unittest.TestCase):
@@ -111,11 +160,12 @@ class TestDemiurgeVillageStructure(unittest.TestCase):
 class TestShapekeyAddonModernization(unittest.TestCase):
     """Test the modernized Nines Shapekey Oversight Fixer addon"""
     
-    def setUp(self):
-        self.addon_path = os.path.join("demiurge_village", "nines_shapekey_oversight_fixer.py")
-        with open(self.addon_path, 'r') as f:
-            self.addon_code = f.read()
-        self.addon_ast = ast.parse(self.addon_code)
+    addon_path = _SHAPEKEY_ADDON_PATH
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addon_code, cls.addon_ast = _load_and_parse(cls.addon_path)
+        cls.index = _AddonIndexer.index(cls.addon_ast)
         
     def test_python_syntax_valid(self):
         """Test that the shapekey addon has valid Python syntax"""
@@ -150,15 +200,12 @@ class TestShapekeyAddonModernization(unittest.TestCase):
         self.assertTrue(has_props, "Should use modern property definitions")
         
         # Should have poll methods for operators
-        self.assertIn("def poll(cls, context):", self.addon_code)
+        self.assertTrue(self.index['has_poll'], "Should define poll methods")
         
     def test_required_classes_present(self):
         """Test that required operator and panel classes are present"""
-        class_names = []
-        for node in ast.walk(self.addon_ast):
-            if isinstance(node, ast.ClassDef):
-                class_names.append(node.name)
-                
+        class_names = self.index['classes']
+        
         # Should have shapekey-related operators
         shapekey_classes = [name for name in class_names if 'Shapekey' in name or 'MESH_OT_' in name]
         self.assertGreater(len(shapekey_classes), 0, 
@@ -171,25 +218,20 @@ class TestShapekeyAddonModernization(unittest.TestCase):
                           
     def test_no_deprecated_patterns(self):
         """Test that no deprecated API patterns are used"""
-        deprecated_patterns = [
-            "bpy.utils.register_module",
-            "context.scene.objects",
-            "bl_space_type = 'UV'",  # Should be IMAGE_EDITOR
-        ]
-        
-        for pattern in deprecated_patterns:
-            self.assertNotIn(pattern, self.addon_code, 
+        found = set(_DEPRECATED_RE.findall(self.addon_code))
+        for pattern in DEPRECATED_PATTERNS:
+            self.assertNotIn(pattern, found, 
                            f"Should not use deprecated pattern: {pattern}")
 
 
 class TestStitchToolAddon(unittest.TestCase):
     """Test the new Nazarick Stitch Tool addon"""
     
-    def setUp(self):
-        self.addon_path = os.path.join("demiurge_village", "nazarick_stitch_tool.py")
-        with open(self.addon_path, 'r') as f:
-            self.addon_code = f.read()
-        self.addon_ast = ast.parse(self.addon_code)
+    addon_path = _STITCH_ADDON_PATH
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addon_code, cls.addon_ast = _load_and_parse(cls.addon_path)
         
     def test_python_syntax_valid(self):
         """Test that the stitch tool has valid Python syntax"""
@@ -239,10 +281,11 @@ class TestStitchToolAddon(unittest.TestCase):
 class TestUVAddonModernization(unittest.TestCase):
     """Test the modernized UV addon"""
     
-    def setUp(self):
-        self.addon_path = os.path.join("demiurge_village", "uv_total_ratio_compare_modernized.py")
-        with open(self.addon_path, 'r') as f:
-            self.addon_code = f.read()
+    addon_path = _UV_ADDON_PATH
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addon_code, _ = _load_and_parse(cls.addon_path)
             
     def test_python_syntax_valid(self):
         """Test that the modernized UV addon has valid Python syntax"""
@@ -268,41 +311,29 @@ class TestUVAddonModernization(unittest.TestCase):
 class TestBlender45Compatibility(unittest.TestCase):
     """Test Blender 4.5 compatibility across all addons"""
     
-    def setUp(self):
-        self.addon_files = [
-            os.path.join("demiurge_village", "nines_shapekey_oversight_fixer.py"),
-            os.path.join("demiurge_village", "uv_total_ratio_compare_modernized.py"),
-            os.path.join("demiurge_village", "nazarick_stitch_tool.py")
-        ]
+    addon_files = _ADDON_PATHS
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addon_sources = {path: _read_source(path) for path in cls.addon_files}
         
     def test_all_addons_declare_blender45(self):
         """Test that all addons declare Blender 4.5 compatibility"""
-        for addon_path in self.addon_files:
-            with open(addon_path, 'r') as f:
-                content = f.read()
-            self.assertIn("(4, 5, 0)", content, 
-                         f"{addon_path} should declare Blender 4.5 compatibility")
+        missing = [path for path, content in self.addon_sources.items()
+                   if "(4, 5, 0)" not in content]
+        self.assertFalse(missing, f"{missing} should declare Blender 4.5 compatibility")
                          
     def test_no_deprecated_apis_used(self):
         """Test that no deprecated APIs are used in any addon"""
-        deprecated_patterns = [
-            "bpy.utils.register_module",
-            "bl_space_type = 'UV'",
-            "context.scene.objects",
-        ]
-        
-        for addon_path in self.addon_files:
-            with open(addon_path, 'r') as f:
-                content = f.read()
-            for pattern in deprecated_patterns:
-                self.assertNotIn(pattern, content, 
+        for addon_path, content in self.addon_sources.items():
+            found = set(_DEPRECATED_RE.findall(content))
+            for pattern in DEPRECATED_PATTERNS:
+                self.assertNotIn(pattern, found, 
                                f"{addon_path} should not use deprecated pattern: {pattern}")
                                
     def test_modern_property_definitions(self):
         """Test that all addons use modern property definitions"""
-        for addon_path in self.addon_files:
-            with open(addon_path, 'r') as f:
-                content = f.read()
+        for addon_path, content in self.addon_sources.items():
             if "Property" in content:  # Only test files that use properties
                 has_modern_props = ("bpy.props." in content or 
                                   "from bpy.props import" in content)
@@ -313,30 +344,26 @@ class TestBlender45Compatibility(unittest.TestCase):
 class TestRegistrationPatterns(unittest.TestCase):
     """Test that all addons use proper registration patterns"""
     
-    def setUp(self):
-        self.addon_files = [
-            os.path.join("demiurge_village", "nines_shapekey_oversight_fixer.py"),
-            os.path.join("demiurge_village", "uv_total_ratio_compare_modernized.py"),
-            os.path.join("demiurge_village", "nazarick_stitch_tool.py")
-        ]
+    addon_files = _ADDON_PATHS
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addon_sources = {path: _read_source(path) for path in cls.addon_files}
         
     def test_registration_functions_present(self):
         """Test that register/unregister functions are present"""
-        for addon_path in self.addon_files:
-            with open(addon_path, 'r') as f:
-                content = f.read()
-            self.assertIn("def register():", content, 
-                         f"{addon_path} should have register() function")
-            self.assertIn("def unregister():", content, 
-                         f"{addon_path} should have unregister() function")
+        missing = [(path, func) for path, content in self.addon_sources.items()
+                   for func in ("def register():", "def unregister():")
+                   if func not in content]
+        self.assertFalse(missing, 
+                         "Addons missing register()/unregister(): " + 
+                         ", ".join(f"{path} ({func})" for path, func in missing))
                          
     def test_classes_tuple_defined(self):
         """Test that classes tuple is properly defined"""
-        for addon_path in self.addon_files:
-            with open(addon_path, 'r') as f:
-                content = f.read()
-            self.assertIn("classes = (", content, 
-                         f"{addon_path} should define classes tuple")
+        missing = [path for path, content in self.addon_sources.items()
+                   if "classes = (" not in content]
+        self.assertFalse(missing, f"{missing} should define classes tuple")
 
 
 def run_demiurge_village_tests():
@@ -346,6 +373,8 @@ def run_demiurge_village_tests():
     print("🎖️ Architected by Demiurge for the Great Tomb of Nazarick")
     print("=" * 70)
     
+    _install_mocks()
+    
     # Create test suite
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
@@ -364,19 +393,28 @@ def run_demiurge_village_tests():
         tests = loader.loadTestsFromTestCase(test_class)
         suite.addTests(tests)
     
+    # Counted up front: running the suite releases its tests
+    total_tests = suite.countTestCases()
+    
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
     start_time = time.time()
     result = runner.run(suite)
     end_time = time.time()
     
+    # A setUpClass error is one entry for a whole class whose tests never ran,
+    # so only per-test errors come off testsRun; the rest count against total_tests
+    test_errors = sum(isinstance(test, unittest.TestCase) for test, _ in result.errors)
+    passed_tests = result.testsRun - len(result.failures) - test_errors
+    success_rate = passed_tests / total_tests * 100 if total_tests else 0.0
+    
     # Summary
     print("\n" + "=" * 70)
     print("🏰 DEMIURGE VILLAGE TEST SUMMARY 🏰")
     print(f"Tests run: {result.testsRun}")
     print(f"Failures: {len(result.failures)}")
     print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
+    print(f"Success rate: {success_rate:.1f}%")
     print(f"Execution time: {end_time - start_time:.2f} seconds")
     
     if result.failures:
@@ -16,15 +16,72 @@ For the Glory of the Great Tomb of Nazarick! 🏰
 import sys
 import os
 import ast
+import functools
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _ast_cache import _load_and_parse
+
+_STITCH_TOOL_PATH = './examples/stitch_tool/nazarick_stitch_tool.py'
+
+
+def _compile_patterns(patterns):
+    """Build one alternation regex so a single scan reports every literal present"""
+    return re.compile('|'.join(map(re.escape, sorted(patterns, key=len, reverse=True))))
+
+
+_ENHANCED_FEATURE_RE = _compile_patterns((
+    'class StitchGeometryManager:',
+    'STITCH_TAG_VERTEX_GROUP = "NAZARICK_STITCHES"',
+    'STITCH_TAG_ATTRIBUTE = "nazarick_stitch_id"',
+    'get_mesh_scale_info',
+    'use_auto_sizing: BoolProperty',
+    'ALL_TAGGED',
+    'LAST_SESSION',
+    'create_stitch_session_id',
+    'MESH_OT_NazarickCalculateAutoSize',
+    'soft_min=',
+    'soft_max=',
+))
+_UI_FEATURE_RE = _compile_patterns((
+    'nazarick_stitch_auto_sizing',
+    'nazarick_stitch_remove_mode',
+    'Tagged stitches:',
+))
+_COMPATIBILITY_RE = _compile_patterns((
+    '"blender": (4, 5, 0)',
+    'edge.link_faces',
+    'edge.faces',
+    'import bpy',
+    'import bmesh',
+    'from mathutils',
+))
+
+# Unanchored substrings, so each count equals str.count() for that token
+_COUNT_RE = re.compile(r'try:|except|description=')
+
+
+@functools.lru_cache(maxsize=None)
+def _token_counts(content):
+    """Count try/except/description tokens in a single pass over the source"""
+    return Counter(m.group() for m in _COUNT_RE.finditer(content))
+
+
+@functools.lru_cache(maxsize=None)
+def _classes_tuple_len(tree):
+    """Number of entries in the module-level ``classes = (...)`` tuple, or None if absent"""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, (ast.Tuple, ast.List)):
+            if any(isinstance(target, ast.Name) and target.id == 'classes' for target in node.targets):
+                return len(node.value.elts)
+    return None
+
 def test_stitch_tool_syntax():
     """Test that the stitch tool has valid Python syntax"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            code = f.read()
-        ast.parse(code)
+        _load_and_parse(_STITCH_TOOL_PATH)
         return True, "✅ Python syntax is valid"
     except SyntaxError as e:
         return False, f"❌ Syntax error: {e}"
@@ -34,59 +91,59 @@ def test_stitch_tool_syntax():
 def test_enhanced_features():
     """Test that enhanced features are implemented"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_and_parse(_STITCH_TOOL_PATH)
+        found = set(_ENHANCED_FEATURE_RE.findall(content))
         
         checks = []
         
         # Check for StitchGeometryManager class
-        if 'class StitchGeometryManager:' in content:
+        if 'class StitchGeometryManager:' in found:
             checks.append("✅ StitchGeometryManager class found")
         else:
             checks.append("❌ StitchGeometryManager class missing")
         
         # Check for tagging constants
-        if 'STITCH_TAG_VERTEX_GROUP = "NAZARICK_STITCHES"' in content:
+        if 'STITCH_TAG_VERTEX_GROUP = "NAZARICK_STITCHES"' in found:
             checks.append("✅ Stitch tagging vertex group constant found")
         else:
             checks.append("❌ Stitch tagging vertex group constant missing")
         
-        if 'STITCH_TAG_ATTRIBUTE = "nazarick_stitch_id"' in content:
+        if 'STITCH_TAG_ATTRIBUTE = "nazarick_stitch_id"' in found:
             checks.append("✅ Stitch tagging attribute constant found")
         else:
             checks.append("❌ Stitch tagging attribute constant missing")
         
         # Check for auto-sizing functionality
-        if 'get_mesh_scale_info' in content:
+        if 'get_mesh_scale_info' in found:
             checks.append("✅ Auto-sizing mesh scale calculation found")
         else:
             checks.append("❌ Auto-sizing mesh scale calculation missing")
         
-        if 'use_auto_sizing: BoolProperty' in content:
+        if 'use_auto_sizing: BoolProperty' in found:
             checks.append("✅ Auto-sizing property found")
         else:
             checks.append("❌ Auto-sizing property missing")
         
         # Check for enhanced removal modes
-        if 'ALL_TAGGED' in content and 'LAST_SESSION' in content:
+        if 'ALL_TAGGED' in found and 'LAST_SESSION' in found:
             checks.append("✅ Enhanced removal modes found")
         else:
             checks.append("❌ Enhanced removal modes missing")
         
         # Check for session tracking
-        if 'create_stitch_session_id' in content:
+        if 'create_stitch_session_id' in found:
             checks.append("✅ Session tracking functionality found")
         else:
             checks.append("❌ Session tracking functionality missing")
         
         # Check for new operator
-        if 'MESH_OT_NazarickCalculateAutoSize' in content:
+        if 'MESH_OT_NazarickCalculateAutoSize' in found:
             checks.append("✅ Auto-size calculation operator found")
         else:
             checks.append("❌ Auto-size calculation operator missing")
         
         # Check for improved parameter ranges
-        if 'soft_min=' in content and 'soft_max=' in content:
+        if 'soft_min=' in found and 'soft_max=' in found:
             checks.append("✅ Improved parameter ranges found")
         else:
             checks.append("❌ Improved parameter ranges missing")
@@ -100,14 +157,14 @@ def test_enhanced_features():
 def test_error_handling():
     """Test that proper error handling is implemented"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_and_parse(_STITCH_TOOL_PATH)
         
         checks = []
         
         # Check for try-except blocks
-        try_count = content.count('try:')
-        except_count = content.count('except')
+        counts = _token_counts(content)
+        try_count = counts['try:']
+        except_count = counts['except']
         
         if try_count >= 3 and except_count >= 3:
             checks.append(f"✅ Error handling found ({try_count} try blocks, {except_count} except blocks)")
@@ -140,32 +197,32 @@ def test_error_handling():
 def test_ui_enhancements():
     """Test that UI enhancements are properly implemented"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_and_parse(_STITCH_TOOL_PATH)
+        found = set(_UI_FEATURE_RE.findall(content))
         
         checks = []
         
         # Check for auto-sizing UI
-        if 'nazarick_stitch_auto_sizing' in content:
+        if 'nazarick_stitch_auto_sizing' in found:
             checks.append("✅ Auto-sizing UI property found")
         else:
             checks.append("❌ Auto-sizing UI property missing")
         
         # Check for removal mode UI
-        if 'nazarick_stitch_remove_mode' in content:
+        if 'nazarick_stitch_remove_mode' in found:
             checks.append("✅ Removal mode UI property found")
         else:
             checks.append("❌ Removal mode UI property missing")
         
         # Check for improved tooltips
-        tooltip_count = content.count('description=')
+        tooltip_count = _token_counts(content)['description=']
         if tooltip_count >= 10:
             checks.append(f"✅ Enhanced tooltips found ({tooltip_count} descriptions)")
         else:
             checks.append(f"❌ Insufficient tooltips ({tooltip_count} descriptions)")
         
         # Check for stitch info display
-        if 'Tagged stitches:' in content:
+        if 'Tagged stitches:' in found:
             checks.append("✅ Stitch information display found")
         else:
             checks.append("❌ Stitch information display missing")
@@ -179,8 +236,7 @@ def test_ui_enhancements():
 def test_class_structure():
     """Test that all required classes are properly defined"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
+        content, tree = _load_and_parse(_STITCH_TOOL_PATH)
         
         checks = []
         
@@ -199,16 +255,13 @@ def test_class_structure():
                 checks.append(f"❌ {class_name} class missing")
         
         # Check classes tuple
-        if 'classes = (' in content:
+        class_count = _classes_tuple_len(tree)
+        if class_count is not None:
             checks.append("✅ Classes tuple found")
-            # Count classes in tuple
-            classes_section = re.search(r'classes = \((.*?)\)', content, re.DOTALL)
-            if classes_section:
-                class_count = len([line for line in classes_section.group(1).split('\n') if line.strip() and not line.strip().startswith('#')])
-                if class_count >= 4:
-                    checks.append(f"✅ Classes tuple has {class_count} classes")
-                else:
-                    checks.append(f"❌ Classes tuple only has {class_count} classes")
+            if class_count >= 4:
+                checks.append(f"✅ Classes tuple has {class_count} classes")
+            else:
+                checks.append(f"❌ Classes tuple only has {class_count} classes")
         else:
             checks.append("❌ Classes tuple missing")
         
@@ -221,25 +274,25 @@ def test_class_structure():
 def test_blender_45_compatibility():
     """Test Blender 4.5+ compatibility"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_and_parse(_STITCH_TOOL_PATH)
+        found = set(_COMPATIBILITY_RE.findall(content))
         
         checks = []
         
         # Check bl_info
-        if '"blender": (4, 5, 0)' in content:
+        if '"blender": (4, 5, 0)' in found:
             checks.append("✅ Blender 4.5+ compatibility declared")
         else:
             checks.append("❌ Blender version not set to 4.5+")
         
         # Check for modern API usage
-        if 'edge.link_faces' in content:
+        if 'edge.link_faces' in found:
             checks.append("✅ Modern edge.link_faces API used")
         else:
             checks.append("❌ Modern edge.link_faces API not found")
         
         # Check for deprecated API absence
-        if 'edge.faces' not in content:
+        if 'edge.faces' not in found:
             checks.append("✅ No deprecated edge.faces API found")
         else:
             checks.append("❌ Deprecated edge.faces API still present")
@@ -247,7 +300,7 @@ def test_blender_45_compatibility():
         # Check for proper imports
         required_imports = ['import bpy', 'import bmesh', 'from mathutils']
         for imp in required_imports:
-            if imp in content:
+            if imp in found:
                 checks.append(f"✅ {imp} found")
             else:
                 checks.append(f"❌ {imp} missing")
@@ -275,10 +328,14 @@ def run_all_tests():
     total_tests = 0
     passed_tests = 0
     
-    for test_name, test_func in tests:
+    # The checks share no mutable state, so run them together and report in order
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [(test_name, executor.submit(test_func)) for test_name, test_func in tests]
+    
+    for test_name, future in futures:
         print(f"\n🧪 Running: {test_name}")
         try:
-            success, result = test_func()
+            success, result = future.result()
             total_tests += 1
             
             if success:
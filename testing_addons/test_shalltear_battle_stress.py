@@ -15,319 +15,368 @@ Motto: "If it cannot survive chaos, it is not worthy of Nazarick"
 import sys
 import os
 import ast
+import functools
+import hashlib
+import io
+import json
 import re
-import random
+import threading
 import time
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_TOOL_PATH = './examples/stitch_tool/nazarick_stitch_tool.py'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tool_source(path=_TOOL_PATH):
+    """Read the stitch tool once per run; a failed read is cached as the returned error"""
+    try:
+        return Path(path).read_bytes().decode('utf-8')
+    except OSError as e:
+        return e
+
+
+def _tool_source():
+    """Return the cached stitch tool source, re-raising a cached read failure"""
+    source = _load_tool_source()
+    if isinstance(source, OSError):
+        raise source
+    return source
+
+# Every literal the suites look for, so one scan of the source answers them all
+_NEEDLES = (
+    'max=100',
+    'stitch_count',
+    'min=0.0001',
+    'stitch_size',
+    'max=0.5',
+    'stitch_depth',
+    'min=0.0',
+    'len(group_verts) < 2:',
+    "obj.type != 'MESH'",
+    "obj.mode != 'EDIT'",
+    'self.vertex_group not in obj.vertex_groups',
+    'if not bm.is_valid:',
+    'soft_max=',
+    'bmesh.update_edit_mesh',
+    'session_id',
+    'string_layer',
+    'edge.is_valid',
+    'vertex_groups.new',
+    'NAZARICK_STITCHES',
+    'layers.string.new',
+    'edge.link_faces',
+    'edge_vector.length',
+    'edge_length',
+    'if not bm.verts:',
+    'get_mesh_scale_info',
+    'bbox_size',
+    'No edges found connecting vertices',
+    'random_variation',
+    'random.random()',
+    'create_stitch_session_id',
+    'time.time()',
+    'find_stitch_geometry',
+    'ALL_TAGGED',
+    'tag_stitch_vertices',
+    "'REGISTER', 'UNDO'",
+    'bpy.types.Scene.',
+)
+
+# Zero-width lookahead so overlapping needles at different offsets are all seen;
+# longest-first so a needle's prefixes can be credited from its matches below
+_SCANNER = re.compile('(?=(%s))' % '|'.join(
+    map(re.escape, sorted(_NEEDLES, key=len, reverse=True))))
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_counts(content):
+    """Occurrence count of every needle, gathered in a single regex pass"""
+    hits = Counter(m.group(1) for m in _SCANNER.finditer(content))
+    return {needle: sum(n for found, n in hits.items() if found.startswith(needle))
+            for needle in _NEEDLES}
+
+def _dotted_name(node):
+    """'bm.verts.layers' for a Name/Attribute chain, None for anything else"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return '.'.join(reversed(parts))
+
+
+@functools.lru_cache(maxsize=1)
+def _structure_index(content):
+    """Structural facts about the tool, gathered from one parse and one tree walk"""
+    try_blocks = poll_methods = 0
+    called = set()
+    for node in ast.walk(ast.parse(content)):
+        if isinstance(node, ast.Try):
+            try_blocks += 1
+        elif isinstance(node, ast.FunctionDef):
+            if node.name == 'poll' and any(
+                    isinstance(d, ast.Name) and d.id == 'classmethod' for d in node.decorator_list):
+                poll_methods += 1
+        elif isinstance(node, ast.Call):
+            called.add(_dotted_name(node.func))
+    return {'try_blocks': try_blocks, 'poll_methods': poll_methods, 'called': called}
+
+_ICONS = {'SURVIVED': '✅', 'VULNERABLE': '💀', 'FAILED': '💥'}
+
 class BattleStressLogger:
     """Logs battle scenarios and their outcomes"""
     
     def __init__(self):
-        self.battle_log = []
+        # Column per field rather than a dict per entry; one logger serves every suite
+        self.suites = []
+        self.scenarios = []
+        self.outcomes = []
+        self.details = []
+        self.timestamps = array('q')  # time.monotonic_ns() readings
         self.total_scenarios = 0
         self.passed_scenarios = 0
         self.failed_scenarios = 0
+        self._lock = threading.Lock()  # Suites log concurrently; keep the columns aligned
     
-    def log_battle(self, scenario, outcome, details=""):
+    def log_battle(self, scenario, outcome, details="", suite=None):
         """Log a battle scenario outcome"""
-        self.battle_log.append({
-            'scenario': scenario,
-            'outcome': outcome,
-            'details': details,
-            'timestamp': time.time()
-        })
-        self.total_scenarios += 1
-        if outcome == "SURVIVED":
-            self.passed_scenarios += 1
-        else:
-            self.failed_scenarios += 1
+        with self._lock:
+            self.suites.append(suite)
+            self.scenarios.append(scenario)
+            self.outcomes.append(outcome)
+            self.details.append(details)
+            self.timestamps.append(time.monotonic_ns())
+            self.total_scenarios += 1
+            if outcome == "SURVIVED":
+                self.passed_scenarios += 1
+            else:
+                self.failed_scenarios += 1
+    
+    def entries(self, suite=None):
+        """(scenario, outcome, details) rows in log order, optionally only one suite's"""
+        rows = zip(self.suites, self.scenarios, self.outcomes, self.details)
+        return [(scenario, outcome, details) for tag, scenario, outcome, details in rows
+                if suite is None or tag == suite]
     
     def generate_battle_report(self):
         """Generate final battle report"""
-        report = [
-            "🩸⚔️ SHALLTEAR'S BATTLE STRESS REPORT ⚔️🩸",
-            "=" * 60,
-            f"📊 Total Scenarios Tested: {self.total_scenarios}",
-            f"✅ Scenarios Survived: {self.passed_scenarios}",
-            f"💀 Scenarios Failed: {self.failed_scenarios}",
-            f"🏆 Survival Rate: {(self.passed_scenarios/self.total_scenarios*100):.1f}%",
-            "",
-            "🗡️ BATTLE LOG:",
-            "-" * 30
-        ]
-        
-        for entry in self.battle_log:
-            outcome_icon = "✅" if entry['outcome'] == "SURVIVED" else "💀"
-            report.append(f"{outcome_icon} {entry['scenario']}: {entry['outcome']}")
-            if entry['details']:
-                report.append(f"   📝 {entry['details']}")
-        
-        return "\n".join(report)
+        buf = io.StringIO()
+        w = buf.write
+        w("🩸⚔️ SHALLTEAR'S BATTLE STRESS REPORT ⚔️🩸\n")
+        w("=" * 60 + "\n")
+        w(f"📊 Total Scenarios Tested: {self.total_scenarios}\n")
+        w(f"✅ Scenarios Survived: {self.passed_scenarios}\n")
+        w(f"💀 Scenarios Failed: {self.failed_scenarios}\n")
+        w(f"🏆 Survival Rate: {(self.passed_scenarios/self.total_scenarios*100):.1f}%\n")
+        w("\n")
+        w("🗡️ BATTLE LOG:\n")
+        w("-" * 30)
+        
+        for scenario, outcome, details in self.entries():
+            outcome_icon = _ICONS.get(outcome, "💀")
+            w(f"\n{outcome_icon} {scenario}: {outcome}")
+            if details:
+                w(f"\n   📝 {details}")
+        
+        return buf.getvalue()
 
-def test_extreme_parameter_ranges():
-    """Test extreme parameter values that could crash the system"""
-    logger = BattleStressLogger()
+# Each check: (scenario, rule, survived details, vulnerable details). A rule is
+# ('all', fact, ...) or ('>=', threshold, fact); '{}' in the survived details
+# receives the measured count. Facts are needles from _NEEDLES or 'ast:' lookups.
+_PARAMETER_RANGE_CHECKS = (
+    ("Massive Stitch Count Limits", ('all', 'max=100', 'stitch_count'),
+     "max=100 limit enforced", "No proper limits found"),
+    ("Microscopic Stitch Size Limits", ('all', 'min=0.0001', 'stitch_size'),
+     "min=0.0001 limit enforced", "No proper minimum limits"),
+    ("Extreme Depth Limits", ('all', 'max=0.5', 'stitch_depth'),
+     "max=0.5 depth limit enforced", "No depth limits found"),
+    ("Negative Value Protection", ('>=', 2, 'min=0.0'),
+     "{} protections found", "Insufficient negative value protection"),
+)
+
+_USER_ABUSE_CHECKS = (
+    ("Empty Vertex Group Protection", ('all', 'len(group_verts) < 2:'),
+     "Validation prevents empty groups", "No empty group validation"),
+    ("Invalid Object Type Protection", ('all', "obj.type != 'MESH'"),
+     "Object type validation found", "No object type validation"),
+    ("Wrong Mode Protection", ('all', "obj.mode != 'EDIT'"),
+     "Edit mode validation found", "No mode validation"),
+    ("Nonexistent Vertex Group Protection", ('all', 'self.vertex_group not in obj.vertex_groups'),
+     "Vertex group validation found", "No vertex group validation"),
+    ("Corrupted Mesh Protection", ('all', 'if not bm.is_valid:'),
+     "Mesh validity checking found", "No mesh validity checking"),
+)
+
+_MEMORY_PERFORMANCE_CHECKS = (
+    ("Large Mesh Soft Limits", ('>=', 3, 'soft_max='),
+     "{} soft limits found", "Insufficient soft limits"),
+    ("Memory Cleanup Protocol", ('all', 'bmesh.update_edit_mesh'),
+     "Mesh update calls found", "No mesh update calls"),
+    ("Vertex Layer Management", ('all', 'ast:call:bm.verts.layers.deform.new'),
+     "Proper layer creation found", "No layer management found"),
+    ("Session Memory Management", ('all', 'session_id', 'string_layer'),
+     "Session tracking implementation found", "No session tracking"),
+    ("Edge Validation Chaos Protection", ('>=', 3, 'edge.is_valid'),
+     "{} validations found", "Insufficient edge validations"),
+)
+
+_API_ABUSE_CHECKS = (
+    ("API Access Exception Handling", ('>=', 3, 'ast:try_blocks'),
+     "{} try blocks found", "Insufficient exception handling"),
+    ("Vertex Group Chaos Protection", ('all', 'vertex_groups.new', 'NAZARICK_STITCHES'),
+     "Controlled vertex group creation", "No vertex group management"),
+    ("Custom Attribute Chaos Protection", ('all', 'layers.string.new', 'ast:try_blocks'),
+     "Protected attribute creation", "Unprotected attribute access"),
+    ("Face-Edge Relationship Chaos", ('all', 'edge.link_faces'),
+     "Modern API usage found", "No edge-face relationship handling"),
+    ("Operator Poll Chaos Protection", ('>=', 2, 'ast:poll_methods'),
+     "{} poll methods found", "Insufficient poll protection"),
+)
+
+_EDGE_CASE_CHECKS = (
+    ("Zero-Length Edge Chaos", ('all', 'edge_vector.length', 'edge_length'),
+     "Edge length calculation found", "No edge length handling"),
+    ("Degenerate Mesh Chaos", ('all', 'if not bm.verts:'),
+     "Empty mesh protection found", "No empty mesh protection"),
+    ("Extreme Scale Chaos", ('all', 'get_mesh_scale_info', 'bbox_size'),
+     "Scale analysis implementation found", "No scale handling"),
+    ("Disconnected Vertex Chaos", ('all', 'No edges found connecting vertices'),
+     "Disconnected vertex detection found", "No disconnected vertex handling"),
+    ("Random Variation Chaos", ('all', 'random_variation', 'random.random()'),
+     "Controlled randomization found", "No randomization handling"),
+)
+
+_CONCURRENT_OPERATION_CHECKS = (
+    ("Multiple Session Chaos", ('all', 'create_stitch_session_id', 'time.time()'),
+     "Unique session ID generation found", "No session ID management"),
+    ("Rapid Create/Remove Chaos", ('all', 'find_stitch_geometry', 'ALL_TAGGED'),
+     "Reliable tagging system found", "No tagging system"),
+    ("Overlapping Stitch Chaos", ('all', 'tag_stitch_vertices', 'NAZARICK_STITCHES'),
+     "Stitch identification system found", "No stitch identification"),
+    ("Undo/Redo Chaos", ('all', "'REGISTER', 'UNDO'"),
+     "Undo support found in operators", "No undo support"),
+    ("UI State Chaos", ('>=', 5, 'bpy.types.Scene.'),
+     "{} scene properties for state persistence", "Insufficient state management"),
+)
+
+def _fact(content, name):
+    """Look up a needle count, or an 'ast:' structural fact parsed only when first asked for"""
+    if name.startswith('ast:'):
+        structure = _structure_index(content)
+        kind, _, path = name[4:].partition(':')
+        return path in structure['called'] if kind == 'call' else structure[kind]
+    return _scan_counts(content)[name]
+
+def _run_battle_checks(failure_scenario, checks, logger=None, suite=None):
+    """Evaluate one suite's check table against the tool source, tagging entries with suite"""
+    if logger is None:
+        logger = BattleStressLogger()
     
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
+        content = _tool_source()
         
-        # Test 1: Massive stitch counts
-        if 'max=100' in content and 'stitch_count' in content:
-            logger.log_battle("Massive Stitch Count Limits", "SURVIVED", "max=100 limit enforced")
-        else:
-            logger.log_battle("Massive Stitch Count Limits", "VULNERABLE", "No proper limits found")
-        
-        # Test 2: Microscopic stitch sizes
-        if 'min=0.0001' in content and 'stitch_size' in content:
-            logger.log_battle("Microscopic Stitch Size Limits", "SURVIVED", "min=0.0001 limit enforced")
-        else:
-            logger.log_battle("Microscopic Stitch Size Limits", "VULNERABLE", "No proper minimum limits")
-        
-        # Test 3: Extreme depth values
-        if 'max=0.5' in content and 'stitch_depth' in content:
-            logger.log_battle("Extreme Depth Limits", "SURVIVED", "max=0.5 depth limit enforced")
-        else:
-            logger.log_battle("Extreme Depth Limits", "VULNERABLE", "No depth limits found")
-        
-        # Test 4: Negative values protection
-        negative_protections = content.count('min=0.0')
-        if negative_protections >= 2:
-            logger.log_battle("Negative Value Protection", "SURVIVED", f"{negative_protections} protections found")
-        else:
-            logger.log_battle("Negative Value Protection", "VULNERABLE", "Insufficient negative value protection")
+        for scenario, rule, survived, vulnerable in checks:
+            if rule[0] == '>=':
+                value = _fact(content, rule[2])
+                passed = value >= rule[1]
+            else:
+                value = None
+                passed = all(_fact(content, name) for name in rule[1:])
+            
+            if passed:
+                logger.log_battle(scenario, "SURVIVED", survived.format(value), suite)
+            else:
+                logger.log_battle(scenario, "VULNERABLE", vulnerable, suite)
         
         return True, logger
         
     except Exception as e:
-        logger.log_battle("Parameter Range Analysis", "FAILED", f"Exception: {str(e)}")
+        logger.log_battle(failure_scenario, "FAILED", f"Exception: {str(e)}", suite)
         return False, logger
 
-def test_user_abuse_scenarios():
+def test_extreme_parameter_ranges(logger=None, suite=None):
+    """Test extreme parameter values that could crash the system"""
+    return _run_battle_checks("Parameter Range Analysis", _PARAMETER_RANGE_CHECKS, logger, suite)
+
+def test_user_abuse_scenarios(logger=None, suite=None):
     """Test scenarios where users try to break the system"""
-    logger = BattleStressLogger()
-    
-    try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
-        
-        # Test 1: Empty vertex group abuse
-        if 'len(group_verts) < 2:' in content:
-            logger.log_battle("Empty Vertex Group Protection", "SURVIVED", "Validation prevents empty groups")
-        else:
-            logger.log_battle("Empty Vertex Group Protection", "VULNERABLE", "No empty group validation")
-        
-        # Test 2: Invalid object type abuse
-        if "obj.type != 'MESH'" in content:
-            logger.log_battle("Invalid Object Type Protection", "SURVIVED", "Object type validation found")
-        else:
-            logger.log_battle("Invalid Object Type Protection", "VULNERABLE", "No object type validation")
-        
-        # Test 3: Wrong mode abuse
-        if "obj.mode != 'EDIT'" in content:
-            logger.log_battle("Wrong Mode Protection", "SURVIVED", "Edit mode validation found")
-        else:
-            logger.log_battle("Wrong Mode Protection", "VULNERABLE", "No mode validation")
-        
-        # Test 4: Nonexistent vertex group abuse
-        if 'self.vertex_group not in obj.vertex_groups' in content:
-            logger.log_battle("Nonexistent Vertex Group Protection", "SURVIVED", "Vertex group validation found")
-        else:
-            logger.log_battle("Nonexistent Vertex Group Protection", "VULNERABLE", "No vertex group validation")
-        
-        # Test 5: Corrupted mesh data abuse
-        if 'if not bm.is_valid:' in content:
-            logger.log_battle("Corrupted Mesh Protection", "SURVIVED", "Mesh validity checking found")
-        else:
-            logger.log_battle("Corrupted Mesh Protection", "VULNERABLE", "No mesh validity checking")
-        
-        return True, logger
-        
-    except Exception as e:
-        logger.log_battle("User Abuse Analysis", "FAILED", f"Exception: {str(e)}")
-        return False, logger
+    return _run_battle_checks("User Abuse Analysis", _USER_ABUSE_CHECKS, logger, suite)
 
-def test_memory_and_performance_chaos():
+def test_memory_and_performance_chaos(logger=None, suite=None):
     """Test scenarios that could cause memory leaks or performance issues"""
-    logger = BattleStressLogger()
-    
-    try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
-        
-        # Test 1: Large mesh handling
-        soft_limits = content.count('soft_max=')
-        if soft_limits >= 3:
-            logger.log_battle("Large Mesh Soft Limits", "SURVIVED", f"{soft_limits} soft limits found")
-        else:
-            logger.log_battle("Large Mesh Soft Limits", "VULNERABLE", "Insufficient soft limits")
-        
-        # Test 2: Memory cleanup patterns
-        if 'bmesh.update_edit_mesh' in content:
-            logger.log_battle("Memory Cleanup Protocol", "SURVIVED", "Mesh update calls found")
-        else:
-            logger.log_battle("Memory Cleanup Protocol", "VULNERABLE", "No mesh update calls")
-        
-        # Test 3: Vertex layer management
-        if 'bm.verts.layers.deform.new()' in content:
-            logger.log_battle("Vertex Layer Management", "SURVIVED", "Proper layer creation found")
-        else:
-            logger.log_battle("Vertex Layer Management", "VULNERABLE", "No layer management found")
-        
-        # Test 4: Session tracking memory
-        if 'session_id' in content and 'string_layer' in content:
-            logger.log_battle("Session Memory Management", "SURVIVED", "Session tracking implementation found")
-        else:
-            logger.log_battle("Session Memory Management", "VULNERABLE", "No session tracking")
-        
-        # Test 5: Edge case iteration protection
-        edge_validations = content.count('edge.is_valid')
-        if edge_validations >= 3:
-            logger.log_battle("Edge Validation Chaos Protection", "SURVIVED", f"{edge_validations} validations found")
-        else:
-            logger.log_battle("Edge Validation Chaos Protection", "VULNERABLE", "Insufficient edge validations")
-        
-        return True, logger
-        
-    except Exception as e:
-        logger.log_battle("Memory/Performance Analysis", "FAILED", f"Exception: {str(e)}")
-        return False, logger
+    return _run_battle_checks("Memory/Performance Analysis", _MEMORY_PERFORMANCE_CHECKS, logger, suite)
 
-def test_api_abuse_scenarios():
+def test_api_abuse_scenarios(logger=None, suite=None):
     """Test scenarios where the Blender API could be abused or fail"""
-    logger = BattleStressLogger()
-    
-    try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
-        
-        # Test 1: bmesh access failure handling
-        try_blocks = content.count('try:')
-        if try_blocks >= 3:
-            logger.log_battle("API Access Exception Handling", "SURVIVED", f"{try_blocks} try blocks found")
-        else:
-            logger.log_battle("API Access Exception Handling", "VULNERABLE", "Insufficient exception handling")
-        
-        # Test 2: Vertex group manipulation chaos
-        if 'vertex_groups.new' in content and 'NAZARICK_STITCHES' in content:
-            logger.log_battle("Vertex Group Chaos Protection", "SURVIVED", "Controlled vertex group creation")
-        else:
-            logger.log_battle("Vertex Group Chaos Protection", "VULNERABLE", "No vertex group management")
-        
-        # Test 3: Custom attribute chaos
-        if 'layers.string.new' in content and 'try:' in content:
-            logger.log_battle("Custom Attribute Chaos Protection", "SURVIVED", "Protected attribute creation")
-        else:
-            logger.log_battle("Custom Attribute Chaos Protection", "VULNERABLE", "Unprotected attribute access")
-        
-        # Test 4: Face/edge relationship chaos
-        if 'edge.link_faces' in content:
-            logger.log_battle("Face-Edge Relationship Chaos", "SURVIVED", "Modern API usage found")
-        else:
-            logger.log_battle("Face-Edge Relationship Chaos", "VULNERABLE", "No edge-face relationship handling")
-        
-        # Test 5: Operator poll chaos
-        poll_methods = content.count('@classmethod\n    def poll(')
-        if poll_methods >= 2:
-            logger.log_battle("Operator Poll Chaos Protection", "SURVIVED", f"{poll_methods} poll methods found")
-        else:
-            logger.log_battle("Operator Poll Chaos Protection", "VULNERABLE", "Insufficient poll protection")
-        
-        return True, logger
-        
-    except Exception as e:
-        logger.log_battle("API Abuse Analysis", "FAILED", f"Exception: {str(e)}")
-        return False, logger
+    return _run_battle_checks("API Abuse Analysis", _API_ABUSE_CHECKS, logger, suite)
 
-def test_edge_case_chaos():
+def test_edge_case_chaos(logger=None, suite=None):
     """Test bizarre edge cases that could occur in real usage"""
-    logger = BattleStressLogger()
-    
-    try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
-        
-        # Test 1: Zero-length edge chaos
-        if 'edge_vector.length' in content and 'edge_length' in content:
-            logger.log_battle("Zero-Length Edge Chaos", "SURVIVED", "Edge length calculation found")
-        else:
-            logger.log_battle("Zero-Length Edge Chaos", "VULNERABLE", "No edge length handling")
-        
-        # Test 2: Degenerate mesh chaos  
-        if 'if not bm.verts:' in content:
-            logger.log_battle("Degenerate Mesh Chaos", "SURVIVED", "Empty mesh protection found")
-        else:
-            logger.log_battle("Degenerate Mesh Chaos", "VULNERABLE", "No empty mesh protection")
-        
-        # Test 3: Extreme scale chaos
-        if 'get_mesh_scale_info' in content and 'bbox_size' in content:
-            logger.log_battle("Extreme Scale Chaos", "SURVIVED", "Scale analysis implementation found")
-        else:
-            logger.log_battle("Extreme Scale Chaos", "VULNERABLE", "No scale handling")
-        
-        # Test 4: Disconnected vertex group chaos
-        if 'No edges found connecting vertices' in content:
-            logger.log_battle("Disconnected Vertex Chaos", "SURVIVED", "Disconnected vertex detection found")
-        else:
-            logger.log_battle("Disconnected Vertex Chaos", "VULNERABLE", "No disconnected vertex handling")
-        
-        # Test 5: Random variation chaos
-        if 'random_variation' in content and 'random.random()' in content:
-            logger.log_battle("Random Variation Chaos", "SURVIVED", "Controlled randomization found")
-        else:
-            logger.log_battle("Random Variation Chaos", "VULNERABLE", "No randomization handling")
-        
-        return True, logger
-        
-    except Exception as e:
-        logger.log_battle("Edge Case Analysis", "FAILED", f"Exception: {str(e)}")
-        return False, logger
+    return _run_battle_checks("Edge Case Analysis", _EDGE_CASE_CHECKS, logger, suite)
 
-def test_concurrent_operation_chaos():
+def test_concurrent_operation_chaos(logger=None, suite=None):
     """Test scenarios involving multiple operations or rapid successive operations"""
-    logger = BattleStressLogger()
-    
+    return _run_battle_checks("Concurrent Operation Analysis", _CONCURRENT_OPERATION_CHECKS, logger, suite)
+
+_RESULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'shalltear'
+
+def _results_cache_key():
+    """SHA-256 of the tool source plus these checks, or None when the tool is unreadable"""
+    source = _load_tool_source()
+    if isinstance(source, OSError):
+        return None
+    digest = hashlib.sha256(source.encode('utf-8'))
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+def _load_cached_results(key):
+    """Rebuild (successes, shared logger) from a previous run over identical sources"""
     try:
-        with open('./examples/stitch_tool/nazarick_stitch_tool.py', 'r') as f:
-            content = f.read()
-        
-        # Test 1: Multiple session chaos
-        if 'create_stitch_session_id' in content and 'time.time()' in content:
-            logger.log_battle("Multiple Session Chaos", "SURVIVED", "Unique session ID generation found")
-        else:
-            logger.log_battle("Multiple Session Chaos", "VULNERABLE", "No session ID management")
-        
-        # Test 2: Rapid creation/removal chaos
-        if 'find_stitch_geometry' in content and 'ALL_TAGGED' in content:
-            logger.log_battle("Rapid Create/Remove Chaos", "SURVIVED", "Reliable tagging system found")
-        else:
-            logger.log_battle("Rapid Create/Remove Chaos", "VULNERABLE", "No tagging system")
-        
-        # Test 3: Overlapping stitch chaos
-        if 'tag_stitch_vertices' in content and 'NAZARICK_STITCHES' in content:
-            logger.log_battle("Overlapping Stitch Chaos", "SURVIVED", "Stitch identification system found")
-        else:
-            logger.log_battle("Overlapping Stitch Chaos", "VULNERABLE", "No stitch identification")
-        
-        # Test 4: Undo/redo chaos
-        if "'REGISTER', 'UNDO'" in content:
-            logger.log_battle("Undo/Redo Chaos", "SURVIVED", "Undo support found in operators")
-        else:
-            logger.log_battle("Undo/Redo Chaos", "VULNERABLE", "No undo support")
-        
-        # Test 5: UI state chaos
-        scene_props = content.count('bpy.types.Scene.')
-        if scene_props >= 5:
-            logger.log_battle("UI State Chaos", "SURVIVED", f"{scene_props} scene properties for state persistence")
-        else:
-            logger.log_battle("UI State Chaos", "VULNERABLE", "Insufficient state management")
-        
-        return True, logger
-        
-    except Exception as e:
-        logger.log_battle("Concurrent Operation Analysis", "FAILED", f"Exception: {str(e)}")
-        return False, logger
+        with open(_RESULT_CACHE_DIR / f"{key}.json", encoding='utf-8') as f:
+            payload = json.load(f)
+        logger = BattleStressLogger()
+        for suite, scenario, outcome, details in payload['entries']:
+            logger.log_battle(scenario, outcome, details, suite)
+        return payload['results'], logger
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+def _store_cached_results(key, results, logger):
+    """Publish suite outcomes atomically so a concurrent run never reads a partial file"""
+    payload = {
+        'results': results,
+        'entries': list(zip(logger.suites, logger.scenarios, logger.outcomes, logger.details)),
+    }
+    cache_file = _RESULT_CACHE_DIR / f"{key}.json"
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        _RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+def _run_suites(test_suites, logger):
+    """Run the suites concurrently into one logger; each result is success or the exception raised"""
+    with ThreadPoolExecutor(max_workers=len(test_suites)) as executor:
+        futures = [executor.submit(test_func, logger, suite_name)
+                   for suite_name, test_func in test_suites]
+    
+    results = []
+    for future in futures:
+        try:
+            success, _ = future.result()
+            results.append(success)
+        except Exception as e:
+            results.append(e)
+    return results
 
 def run_shalltear_battle_stress():
     """Execute all battle stress tests"""
@@ -346,23 +395,33 @@ def run_shalltear_battle_stress():
         ("Concurrent Operation Warfare", test_concurrent_operation_chaos)
     ]
     
-    total_loggers = []
+    completed_suites = []
     all_passed = True
     
-    for suite_name, test_func in test_suites:
+    # Outcomes are deterministic for a given tool source and set of checks
+    cache_key = _results_cache_key()
+    cached = _load_cached_results(cache_key) if cache_key else None
+    if cached is not None:
+        results, logger = cached
+    else:
+        logger = BattleStressLogger()
+        results = _run_suites(test_suites, logger)
+        if cache_key and not any(isinstance(result, Exception) for result in results):
+            _store_cached_results(cache_key, results, logger)
+    
+    for (suite_name, _), success in zip(test_suites, results):
         print(f"⚔️ Executing: {suite_name}")
-        try:
-            success, logger = test_func()
-            total_loggers.append(logger)
-            
-            if success:
-                print(f"✅ {suite_name} - Battle Survived")
-            else:
-                print(f"💀 {suite_name} - Casualties Sustained")
-                all_passed = False
-                
-        except Exception as e:
-            print(f"💥 {suite_name} - Critical Failure: {e}")
+        if isinstance(success, Exception):
+            print(f"💥 {suite_name} - Critical Failure: {success}")
+            all_passed = False
+            continue
+        
+        completed_suites.append(suite_name)
+        
+        if success:
+            print(f"✅ {suite_name} - Battle Survived")
+        else:
+            print(f"💀 {suite_name} - Casualties Sustained")
             all_passed = False
     
     # Generate combined battle report
@@ -370,9 +429,9 @@ def run_shalltear_battle_stress():
     print("⚔️ SHALLTEAR'S FINAL BATTLE ASSESSMENT ⚔️")
     print("🩸" + "=" * 58 + "🩸")
     
-    total_scenarios = sum(logger.total_scenarios for logger in total_loggers)
-    total_survived = sum(logger.passed_scenarios for logger in total_loggers)
-    total_failed = sum(logger.failed_scenarios for logger in total_loggers)
+    total_scenarios = logger.total_scenarios
+    total_survived = logger.passed_scenarios
+    total_failed = logger.failed_scenarios
     
     print(f"📊 Total Battle Scenarios: {total_scenarios}")
     print(f"✅ Scenarios Survived: {total_survived}")
@@ -393,19 +452,19 @@ def run_shalltear_battle_stress():
             print("\n💀 INSUFFICIENT FORTIFICATION")
             print("⚠️ The code requires significant strengthening")
     
-    # Detailed battle logs
-    print("\n🗡️ DETAILED BATTLE LOGS:")
-    print("-" * 40)
-    for i, logger in enumerate(total_loggers):
-        suite_name = test_suites[i][0]
-        print(f"\n📋 {suite_name}:")
-        for entry in logger.battle_log:
-            outcome_icon = "✅" if entry['outcome'] == "SURVIVED" else "💀"
-            print(f"  {outcome_icon} {entry['scenario']}: {entry['outcome']}")
-            if entry['details']:
-                print(f"     📝 {entry['details']}")
+    # Detailed battle logs, composed in full and written once
+    out = ["\n🗡️ DETAILED BATTLE LOGS:", "-" * 40]
+    for suite_name in completed_suites:
+        out.append(f"\n📋 {suite_name}:")
+        for scenario, outcome, details in logger.entries(suite_name):
+            out.append(f"  {_ICONS.get(outcome, '💀')} {scenario}: {outcome}")
+            if details:
+                out.append(f"     📝 {details}")
     
-    print(f"\n🩸 Battle Assessment Complete - Glory to Nazarick! 🩸")
+    out.append(f"\n🩸 Battle Assessment Complete - Glory to Nazarick! 🩸")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
     return all_passed
 
 if __name__ == "__main__":
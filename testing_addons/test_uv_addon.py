@@ -14,20 +14,53 @@ Author: Nines Own Goal
 
 import unittest
 import sys
+import os
 import ast
 import math
+import functools
 import importlib.util
 from unittest.mock import Mock, MagicMock, patch
 from typing import List, Tuple, Any
 
+# NumPy ships with Blender but may be missing from a bare CI interpreter
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_ADDON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uv_ratio_tool.py')
+
+@functools.lru_cache(maxsize=1)
+def _load_addon():
+    """Read and parse the addon once per process, returning (source, tree)"""
+    with open(_ADDON_PATH, 'r', encoding='utf-8') as f:
+        source = f.read()
+    return source, ast.parse(source)
+
+@functools.lru_cache(maxsize=1)
+def _addon_functions():
+    """Map each top-level function name in the addon to its source segment"""
+    source, tree = _load_addon()
+    return {node.name: ast.get_source_segment(source, node)
+            for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+def _exec_addon_functions(names, namespace):
+    """Execute the named addon functions into namespace and return it"""
+    functions = _addon_functions()
+    exec('\n\n'.join(functions[name] for name in names), namespace)
+    return namespace
+
 # Mock Blender modules for testing outside Blender environment
 class MockVector:
     """Mock mathutils.Vector for testing"""
+    __slots__ = ('x', 'y', 'z', '_length')
+    
     def __init__(self, x=0.0, y=0.0, z=0.0):
         if isinstance(x, (list, tuple)):
             self.x, self.y, self.z = x[0], x[1], x[2] if len(x) > 2 else 0.0
         else:
             self.x, self.y, self.z = x, y, z
+        self._length = -1.0  # Computed on first access to .length
     
     def __sub__(self, other):
         return MockVector(self.x - other.x, self.y - other.y, self.z - other.z)
@@ -38,12 +71,14 @@ class MockVector:
         cy = self.z * other.x - self.x * other.z
         cz = self.x * other.y - self.y * other.x
         result = MockVector(cx, cy, cz)
-        result.length = math.sqrt(cx*cx + cy*cy + cz*cz)
+        result._length = math.sqrt(cx*cx + cy*cy + cz*cz)
         return result
     
     @property
     def length(self):
-        return math.sqrt(self.x*self.x + self.y*self.y + self.z*self.z)
+        if self._length < 0:
+            self._length = math.sqrt(self.x*self.x + self.y*self.y + self.z*self.z)
+        return self._length
 
 class MockBlenderType:
     """Base mock class for Blender types"""
@@ -90,11 +125,10 @@ class MockUV:
 class TestAddonStructure(unittest.TestCase):
     """Test the basic structure and syntax of the addon"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Load the addon file for testing"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            self.addon_code = f.read()
-        self.ast_tree = ast.parse(self.addon_code)
+        cls.addon_code, cls.ast_tree = _load_addon()
     
     def test_python_syntax_valid(self):
         """Test that the Python syntax is valid"""
@@ -151,38 +185,17 @@ class TestAddonStructure(unittest.TestCase):
 class TestMathematicalFunctions(unittest.TestCase):
     """Test the mathematical functions used in the addon"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up isolated test environment for math functions"""
-        # Extract just the mathematical functions for testing
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
-        
-        # Extract face_area_3d function
-        start = content.find('def face_area_3d(face):')
-        end = content.find('\ndef ', start + 1)
-        if end == -1:
-            end = content.find('\nclass ', start + 1)
-        face_area_3d_code = content[start:end]
-        
-        # Extract face_area_uv function  
-        start = content.find('def face_area_uv(face, uv_layer):')
-        end = content.find('\ndef ', start + 1)
-        if end == -1:
-            end = content.find('\nclass ', start + 1)
-        face_area_uv_code = content[start:end]
-        
-        # Create namespace with mock Vector
-        test_namespace = {
+        # Execute just the mathematical functions in an isolated namespace with mock Vector
+        test_namespace = _exec_addon_functions(('face_area_3d', 'face_area_uv'), {
             'Vector': MockVector,
             '__name__': '__main__'
-        }
+        })
         
-        # Execute the functions in isolated namespace
-        exec(face_area_3d_code, test_namespace)
-        exec(face_area_uv_code, test_namespace)
-        
-        self.face_area_3d = test_namespace['face_area_3d']
-        self.face_area_uv = test_namespace['face_area_uv']
+        cls.face_area_3d = staticmethod(test_namespace['face_area_3d'])
+        cls.face_area_uv = staticmethod(test_namespace['face_area_uv'])
     
     def test_triangle_3d_area(self):
         """Test 3D area calculation for a simple triangle"""
@@ -244,13 +257,65 @@ class TestMathematicalFunctions(unittest.TestCase):
         self.assertAlmostEqual(area, 0.0, places=6,
                               msg="Collinear points should have zero area")
 
+@unittest.skipIf(np is None, "NumPy not available")
+class TestVectorizedAreas(unittest.TestCase):
+    """Test the mesh-wide NumPy area helpers against known shapes"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Execute the vectorized helpers with NumPy in an isolated namespace"""
+        namespace = _exec_addon_functions(
+            ('_fan_triangles', 'all_face_areas_3d', 'all_face_areas_uv', '_accumulate_areas_numpy',
+             '_face_areas', '_accumulate_areas_kernel', '_accumulate_areas_parallel_kernel'),
+            {'np': np, 'prange': range, '__name__': '__main__'})
+        cls.all_face_areas_3d = staticmethod(namespace['all_face_areas_3d'])
+        cls.all_face_areas_uv = staticmethod(namespace['all_face_areas_uv'])
+        cls.accumulate_numpy = staticmethod(namespace['_accumulate_areas_numpy'])
+        cls.accumulate_kernel = staticmethod(namespace['_accumulate_areas_kernel'])
+        cls.accumulate_parallel = staticmethod(namespace['_accumulate_areas_parallel_kernel'])
+        
+        # Triangle, unit square, edge and an L-shaped (concave) hexagon in one loop buffer
+        cls.loop_coords = np.array([
+            (0, 0, 0), (1, 0, 0), (0, 1, 0),
+            (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+            (0, 0, 0), (1, 0, 0),
+            (0, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0), (1, 2, 0), (0, 2, 0),
+        ], dtype=np.float64)
+        cls.loop_uvs = cls.loop_coords[:, :2] * 0.5
+        cls.face_offsets = np.array([0, 3, 7, 9, 15])
+    
+    def test_per_face_3d_areas(self):
+        """Test that every face's 3D area comes out of one batched call"""
+        areas = self.all_face_areas_3d(self.loop_coords, self.face_offsets)
+        np.testing.assert_allclose(areas, [0.5, 1.0, 0.0, 3.0])
+    
+    def test_per_face_uv_areas(self):
+        """Test the shoelace UV areas, including the concave face"""
+        areas = self.all_face_areas_uv(self.loop_uvs, self.face_offsets)
+        np.testing.assert_allclose(areas, [0.125, 0.25, 0.0, 0.75])
+    
+    def test_kernel_matches_numpy_path(self):
+        """Test that the numba kernel source agrees with the NumPy fallback"""
+        expected = self.accumulate_numpy(self.loop_coords, self.loop_uvs, self.face_offsets)
+        actual = self.accumulate_kernel(self.loop_coords, self.loop_uvs, self.face_offsets)
+        self.assertAlmostEqual(actual[0], expected[0], places=9)
+        self.assertAlmostEqual(actual[1], expected[1], places=9)
+        self.assertEqual(actual[2], expected[2])
+    
+    def test_parallel_kernel_matches_serial(self):
+        """Test that the prange kernel reduces to the same totals as the serial one"""
+        expected = self.accumulate_kernel(self.loop_coords, self.loop_uvs, self.face_offsets)
+        actual = self.accumulate_parallel(self.loop_coords, self.loop_uvs, self.face_offsets)
+        self.assertAlmostEqual(actual[0], expected[0], places=9)
+        self.assertAlmostEqual(actual[1], expected[1], places=9)
+        self.assertEqual(actual[2], expected[2])
+
 class TestBlenderIntegration(unittest.TestCase):
     """Test Blender-specific integration aspects"""
     
     def test_operator_class_names(self):
         """Test that operator classes have correct naming convention"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for operator naming conventions
         self.assertIn('class UV_OT_TotalUV3DRatio', content)
@@ -262,8 +327,7 @@ class TestBlenderIntegration(unittest.TestCase):
     
     def test_panel_class_names(self):
         """Test that panel classes have correct naming convention"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for panel naming conventions
         self.assertIn('class UV_PT_NazarickRatioPanel', content)
@@ -275,16 +339,14 @@ class TestBlenderIntegration(unittest.TestCase):
     
     def test_mixin_class_present(self):
         """Test that the mixin class is properly defined"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         self.assertIn('class NazarickRatioPanelMixin:', content)
         self.assertIn('def draw_ratio_panel(self, context, layout):', content)
     
     def test_classes_tuple_definition(self):
         """Test that classes tuple is properly defined"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         self.assertIn('classes = (', content)
         self.assertIn('UV_OT_TotalUV3DRatio,', content)
@@ -310,8 +372,7 @@ class TestAddonCompatibility(unittest.TestCase):
     
     def test_addon_metadata(self):
         """Test addon metadata for Blender compatibility"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for required metadata
         self.assertIn('"name":', content)
@@ -324,13 +385,12 @@ class TestAddonCompatibility(unittest.TestCase):
     
     def test_import_requirements(self):
         """Test that required imports are present"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for required imports
         self.assertIn('import bpy', content)
         self.assertIn('import bmesh', content)
-        self.assertIn('from mathutils import Vector', content)
+        self.assertIn('import numpy as np', content)
         self.assertIn('import time', content)
 
 class TestCodeQuality(unittest.TestCase):
@@ -338,25 +398,22 @@ class TestCodeQuality(unittest.TestCase):
     
     def test_function_docstrings(self):
         """Test that key functions have docstrings"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for function docstrings
-        self.assertIn('"""Calculate the 3D area of a face using triangulation."""', content)
-        self.assertIn('"""Calculate the UV area of a face using triangulation."""', content)
+        self.assertIn('"""Calculate the 3D area of a face using triangulation.', content)
+        self.assertIn('"""Calculate the UV area of a face using triangulation.', content)
     
     def test_class_docstrings(self):
         """Test that classes have appropriate docstrings"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for class documentation
         self.assertIn('"""Shared drawing logic for UV/3D ratio panels', content)
     
     def test_no_obvious_syntax_errors(self):
         """Test that there are no obvious syntax issues"""
-        with open('../src/addons/uv_ratio_tool.py', 'r') as f:
-            content = f.read()
+        content, _ = _load_addon()
         
         # Check for common syntax issues
         self.assertNotIn('print(', content)  # No debug prints left
@@ -384,6 +441,7 @@ def run_tests():
     test_classes = [
         TestAddonStructure,
         TestMathematicalFunctions,
+        TestVectorizedAreas,
         TestBlenderIntegration,
         TestAddonCompatibility,
         TestCodeQuality
@@ -23,31 +23,285 @@ For Supreme Being Ainz Ooal Gown! ⚡
 
 import bpy
 import bmesh
-from mathutils import Vector
+import numpy as np
+from bpy.app.handlers import persistent
+import bisect
+import math
 import time
 
+try:
+    from numba import njit, prange
+except ImportError:  # Blender does not bundle numba; the NumPy path below covers it
+    njit = None
+    prange = range
+
+# Ratio interpretation bands: _RATIO_LABELS[i] covers ratios up to and including _RATIO_THRESHOLDS[i]
+_RATIO_THRESHOLDS = (0.5, 0.95, 0.99, 1.01, 1.05, 1.5)
+_RATIO_LABELS = (
+    "UVs are MUCH SMALLER than needed (compressed texture)",
+    "UVs are smaller than needed (some compression)",
+    "Good ratio (minor deviation)",
+    "PERFECT - 1:1 UV to 3D ratio",
+    "Good ratio (minor deviation)",
+    "UVs are larger than needed (some stretching)",
+    "UVs are MUCH LARGER than needed (stretched texture)",
+)
+
 def face_area_3d(face):
-    """Calculate the 3D area of a face using triangulation."""
-    verts = [v.co for v in face.verts]
+    """Calculate the 3D area of a face using triangulation.
+
+    Per-face BMesh reference for the tests; the operator measures through
+    _accumulate_areas on bulk loop buffers and never calls this.
+    """
+    verts = face.verts
     if len(verts) < 3:
         return 0.0
+    if len(verts) == 3:
+        # Triangles dominate triangulated meshes; skip the fan loop for them
+        a, b, c = verts[0].co, verts[1].co, verts[2].co
+        return (b - a).cross(c - a).length / 2
+    verts = [v.co for v in verts]
     area = 0.0
     for i in range(1, len(verts) - 1):
         area += (verts[i] - verts[0]).cross(verts[i+1] - verts[0]).length / 2
     return area
 
 def face_area_uv(face, uv_layer):
-    """Calculate the UV area of a face using triangulation."""
-    uvs = [loop[uv_layer].uv for loop in face.loops]
+    """Calculate the UV area of a face using triangulation.
+
+    Per-face BMesh reference for the tests, like face_area_3d.
+    """
+    # One layer lookup per loop; everything below works on plain float pairs
+    uvs = [(uv.x, uv.y) for uv in (loop[uv_layer].uv for loop in face.loops)]
     if len(uvs) < 3:
         return 0.0
-    area = 0.0
-    for i in range(1, len(uvs) - 1):
-        v0 = Vector((uvs[0].x, uvs[0].y, 0.0))
-        v1 = Vector((uvs[i].x, uvs[i].y, 0.0))
-        v2 = Vector((uvs[i+1].x, uvs[i+1].y, 0.0))
-        area += (v1 - v0).cross(v2 - v0).length / 2
-    return area
+    if len(uvs) == 3:
+        (ax, ay), (bx, by), (cx, cy) = uvs
+        return abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / 2
+    if len(uvs) == 4:
+        # Quad area is half the cross product of its diagonals
+        (ax, ay), (bx, by), (cx, cy), (dx, dy) = uvs
+        return abs((ax - cx) * (by - dy) - (bx - dx) * (ay - cy)) / 2
+    # Shoelace formula: signed triangles against the origin, no 3D cross product needed
+    twice_area = 0.0
+    px, py = uvs[-1]
+    for x, y in uvs:
+        twice_area += px * y - x * py
+        px, py = x, y
+    return abs(twice_area) / 2
+
+def _fan_triangles(face_offsets):
+    """Loop indices (face, a, b, c) of every fan triangle in a flat per-loop buffer."""
+    sizes = np.diff(face_offsets)
+    tri_counts = np.maximum(sizes - 2, 0)
+    tri_face = np.repeat(np.arange(len(sizes)), tri_counts)
+    # Position of each triangle inside its own face's fan
+    first_tri = np.cumsum(tri_counts) - tri_counts
+    fan_step = np.arange(tri_counts.sum()) - np.repeat(first_tri, tri_counts)
+    a = face_offsets[:-1][tri_face]
+    b = a + fan_step + 1
+    return tri_face, a, b, b + 1
+
+def all_face_areas_3d(loop_coords, face_offsets):
+    """Calculate the 3D area of every face at once from per-loop vertex coordinates."""
+    tri_face, a, b, c = _fan_triangles(face_offsets)
+    v0 = loop_coords[a]
+    cross = np.cross(loop_coords[b] - v0, loop_coords[c] - v0)
+    # Row-wise squared lengths via einsum, then one batched sqrt
+    tri_areas = 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross))
+    return np.bincount(tri_face, weights=tri_areas, minlength=len(face_offsets) - 1)
+
+def all_face_areas_uv(loop_uvs, face_offsets):
+    """Calculate the UV area of every face at once using the shoelace formula."""
+    sizes = np.diff(face_offsets)
+    loop_face = np.repeat(np.arange(len(sizes)), sizes)
+    # Each loop's successor, wrapping the last loop of a face back to its first
+    following = np.arange(1, len(loop_uvs) + 1)
+    filled = sizes > 0
+    following[face_offsets[1:][filled] - 1] = face_offsets[:-1][filled]
+    # Measure from each face's first UV so float32 products do not cancel catastrophically
+    local_uvs = loop_uvs - loop_uvs[face_offsets[:-1][loop_face]]
+    x, y = local_uvs[:, 0], local_uvs[:, 1]
+    twice_area = np.bincount(loop_face, weights=x * y[following] - x[following] * y,
+                             minlength=len(sizes))
+    areas = 0.5 * np.abs(twice_area)
+    areas[sizes < 3] = 0.0
+    return areas
+
+def _accumulate_areas_numpy(loop_coords, loop_uvs, face_offsets):
+    """Total 3D and UV area plus face count, skipping faces with invalid areas."""
+    areas_3d = all_face_areas_3d(loop_coords, face_offsets)
+    areas_uv = all_face_areas_uv(loop_uvs, face_offsets)
+    # Ordered comparisons are false for NaN, so the bounds reject NaN and +inf alike
+    valid = (areas_3d >= 0) & (areas_3d < np.inf) & (areas_uv >= 0) & (areas_uv < np.inf)
+    return float(areas_3d[valid].sum()), float(areas_uv[valid].sum()), int(valid.sum())
+
+def _face_areas(loop_coords, loop_uvs, start, end):
+    """3D fan area and UV shoelace area of one face's loop range, for the numba kernels."""
+    area_3d = 0.0
+    twice_uv = 0.0
+    if end - start >= 3:
+        # float64 anchors promote the float32 buffer reads for all arithmetic below
+        x0 = np.float64(loop_coords[start, 0])
+        y0 = np.float64(loop_coords[start, 1])
+        z0 = np.float64(loop_coords[start, 2])
+        for i in range(start + 1, end - 1):
+            ax = loop_coords[i, 0] - x0
+            ay = loop_coords[i, 1] - y0
+            az = loop_coords[i, 2] - z0
+            bx = loop_coords[i + 1, 0] - x0
+            by = loop_coords[i + 1, 1] - y0
+            bz = loop_coords[i + 1, 2] - z0
+            # Cross product inlined; numba has no np.cross
+            cx = ay * bz - az * by
+            cy = az * bx - ax * bz
+            cz = ax * by - ay * bx
+            area_3d += 0.5 * np.sqrt(cx * cx + cy * cy + cz * cz)
+        u0 = np.float64(loop_uvs[start, 0])
+        v0 = np.float64(loop_uvs[start, 1])
+        for i in range(start + 1, end - 1):
+            # Shoelace terms relative to the first UV; those touching it vanish
+            twice_uv += ((loop_uvs[i, 0] - u0) * (loop_uvs[i + 1, 1] - v0)
+                         - (loop_uvs[i + 1, 0] - u0) * (loop_uvs[i, 1] - v0))
+    return area_3d, 0.5 * abs(twice_uv)
+
+def _accumulate_areas_kernel(loop_coords, loop_uvs, face_offsets):
+    """Scalar twin of _accumulate_areas_numpy, written for numba to compile."""
+    total_3d = 0.0
+    total_uv = 0.0
+    face_count = 0
+    for f in range(len(face_offsets) - 1):
+        area_3d, area_uv = _face_areas(loop_coords, loop_uvs, face_offsets[f], face_offsets[f + 1])
+        # Branch-free validity mask; a select rather than area * ok, since inf * 0 is NaN
+        ok = (area_3d >= 0.0) & (area_3d < np.inf) & (area_uv >= 0.0) & (area_uv < np.inf)
+        total_3d += area_3d if ok else 0.0
+        total_uv += area_uv if ok else 0.0
+        face_count += ok
+    return total_3d, total_uv, face_count
+
+def _accumulate_areas_parallel_kernel(loop_coords, loop_uvs, face_offsets):
+    """_accumulate_areas_kernel over prange, reducing per-face slots instead of shared totals."""
+    n_faces = len(face_offsets) - 1
+    areas_3d = np.zeros(n_faces)
+    areas_uv = np.zeros(n_faces)
+    valid = np.zeros(n_faces, dtype=np.int64)
+    for f in prange(n_faces):
+        area_3d, area_uv = _face_areas(loop_coords, loop_uvs, face_offsets[f], face_offsets[f + 1])
+        ok = (area_3d >= 0.0) & (area_3d < np.inf) & (area_uv >= 0.0) & (area_uv < np.inf)
+        areas_3d[f] = area_3d if ok else 0.0
+        areas_uv[f] = area_uv if ok else 0.0
+        valid[f] = ok
+    return areas_3d.sum(), areas_uv.sum(), valid.sum()
+
+# Below this many faces, thread start-up costs more than the parallel kernel saves
+_PARALLEL_MIN_FACES = 4096
+
+if njit is not None:
+    # fastmath without 'nnan'/'ninf' so the finiteness check is not optimized away
+    _FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+    _face_areas = njit(cache=True, fastmath=_FASTMATH_FLAGS)(_face_areas)
+    _accumulate_areas_serial = njit(cache=True, fastmath=_FASTMATH_FLAGS)(_accumulate_areas_kernel)
+    _accumulate_areas_parallel = njit(parallel=True, cache=True, fastmath=_FASTMATH_FLAGS)(
+        _accumulate_areas_parallel_kernel)
+
+def _accumulate_areas(loop_coords, loop_uvs, face_offsets):
+    """Total 3D and UV area plus face count from the fastest available backend."""
+    if njit is None:
+        return _accumulate_areas_numpy(loop_coords, loop_uvs, face_offsets)
+    if len(face_offsets) - 1 >= _PARALLEL_MIN_FACES:
+        return _accumulate_areas_parallel(loop_coords, loop_uvs, face_offsets)
+    return _accumulate_areas_serial(loop_coords, loop_uvs, face_offsets)
+
+def _read_mesh_loops(mesh):
+    """Bulk-copy per-loop vertex and active UV coordinates plus face loop offsets out of a mesh."""
+    n_loops = len(mesh.loops)
+    # Blender stores positions and UVs as float32; keep them narrow and widen only in the sums
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_uvs = np.empty(n_loops * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get('uv', loop_uvs)
+    # Face loops are contiguous, so the loop starts plus the loop count are the offsets
+    face_offsets = np.empty(len(mesh.polygons) + 1, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', face_offsets[:-1])
+    face_offsets[-1] = n_loops
+    return coords.reshape(-1, 3)[loop_verts], loop_uvs.reshape(-1, 2), face_offsets
+
+# Loop buffers of the last measured mesh only, keyed by its session_uid; dropped whenever
+# its geometry or UVs change, another mesh is measured, or a file is loaded
+_loop_buffer_cache = {}
+
+def _get_loop_buffers(mesh):
+    """Cached _read_mesh_loops for a mesh, re-read after any geometry edit."""
+    key = mesh.session_uid
+    buffers = _loop_buffer_cache.get(key)
+    if (buffers is None or len(buffers[2]) - 1 != len(mesh.polygons)
+            or len(buffers[1]) != len(mesh.loops)):
+        buffers = _read_mesh_loops(mesh)
+        for buffer in buffers:
+            buffer.flags.writeable = False
+        _loop_buffer_cache.clear()
+        _loop_buffer_cache[key] = buffers
+    return buffers
+
+def _invalidate_loop_buffers(mesh):
+    """Forget the cached loop buffers of a mesh after changing it directly."""
+    _loop_buffer_cache.pop(mesh.session_uid, None)
+
+@persistent
+def _drop_edited_loop_buffers(scene, depsgraph):
+    """Depsgraph handler invalidating cached buffers of meshes whose geometry was updated."""
+    if not _loop_buffer_cache:
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry:
+            datablock = update.id.original
+            mesh = getattr(datablock, 'data', datablock)
+            _loop_buffer_cache.pop(getattr(mesh, 'session_uid', None), None)
+
+@persistent
+def _drop_all_loop_buffers(filepath):
+    """load_pre handler forgetting every cached buffer, since no mesh outlives its file."""
+    _loop_buffer_cache.clear()
+
+def _take_faces(loop_coords, loop_uvs, face_offsets, face_indices):
+    """Restrict per-loop buffers and offsets to the given faces, preserving their order."""
+    sizes = np.diff(face_offsets)[face_indices]
+    new_offsets = np.zeros(len(face_indices) + 1, dtype=face_offsets.dtype)
+    np.cumsum(sizes, out=new_offsets[1:])
+    loop_indices = (np.repeat(face_offsets[:-1][face_indices] - new_offsets[:-1], sizes)
+                    + np.arange(new_offsets[-1]))
+    return loop_coords[loop_indices], loop_uvs[loop_indices], new_offsets
+
+class NazarickLineItem(bpy.types.PropertyGroup):
+    """One detail line of the ratio result, composed once per measurement"""
+    text: bpy.props.StringProperty()
+
+def _store_details(scene, details):
+    """Set the details text and its split lines so each redraw is one label per line."""
+    scene.nazarick_uv_ratio_details = details
+    lines = scene.nazarick_uv_ratio_lines
+    lines.clear()
+    for line in details.split('\n'):
+        lines.add().text = line
+
+def _store_ratio_result(scene, total_3d, total_uv, source, elapsed):
+    """Keep the measured totals on the scene and format the result and details strings."""
+    ratio = total_uv / total_3d
+    # Create human-readable interpretation from the band the ratio falls in
+    interpretation = _RATIO_LABELS[bisect.bisect_left(_RATIO_THRESHOLDS, ratio)]
+    
+    scene.nazarick_uv_ratio_value = ratio
+    scene.nazarick_uv_ratio_total_3d = total_3d
+    scene.nazarick_uv_ratio_total_uv = total_uv
+    scene.nazarick_uv_ratio_source = source
+    scene.nazarick_uv_ratio_result = f"UV/3D Ratio: {ratio:.4f}"
+    _store_details(scene, f"Interpretation: {interpretation}\n"
+                          f"Calculated from {source}\n"
+                          f"3D Area: {total_3d:.4f} units²\n"
+                          f"UV Area: {total_uv:.4f} units²\n"
+                          f"Time: {elapsed:.3f}s")
 
 class UV_OT_TotalUV3DRatio(bpy.types.Operator):
     bl_idname = "uv.nazarick_total_uv_3d_ratio"
@@ -94,30 +348,25 @@ class UV_OT_TotalUV3DRatio(bpy.types.Operator):
             return {'CANCELLED'}
         
         # Calculate areas - prioritize selected faces, fallback to all faces
-        selected_faces = [face for face in bm.faces if face.select and face.is_valid]
-        faces_to_process = selected_faces if selected_faces else [face for face in bm.faces if face.is_valid]
+        # Sync the edit-mode BMesh into the mesh so foreach_get reads current data
+        obj.update_from_editmode()
+        select_flags = np.zeros(len(obj.data.polygons), dtype=bool)
+        obj.data.polygons.foreach_get('select', select_flags)
+        selected_faces = np.flatnonzero(select_flags)
         
-        if not faces_to_process:
+        if not len(select_flags):
             self.report({'ERROR'}, "No valid faces found to process")
             return {'CANCELLED'}
         
-        total_3d = 0.0
-        total_uv = 0.0
-        face_count = 0
         epsilon = 1e-10  # Numerical precision threshold
         
         try:
-            for face in faces_to_process:
-                area_3d = face_area_3d(face)
-                area_uv = face_area_uv(face, uv_layer)
-                
-                # Validate areas are non-negative and finite
-                if area_3d < 0 or area_uv < 0 or not (math.isfinite(area_3d) and math.isfinite(area_uv)):
-                    continue  # Skip invalid faces
-                
-                total_3d += area_3d
-                total_uv += area_uv
-                face_count += 1
+            loop_coords, loop_uvs, face_offsets = _get_loop_buffers(obj.data)
+            if len(selected_faces):
+                loop_coords, loop_uvs, face_offsets = _take_faces(
+                    loop_coords, loop_uvs, face_offsets, selected_faces)
+            # Faces with negative or non-finite areas are masked out inside the accumulator
+            total_3d, total_uv, face_count = _accumulate_areas(loop_coords, loop_uvs, face_offsets)
                 
         except Exception as e:
             self.report({'ERROR'}, f"Error calculating areas: {str(e)}")
@@ -132,38 +381,15 @@ class UV_OT_TotalUV3DRatio(bpy.types.Operator):
                 self.report({'ERROR'}, "Invalid ratio calculated (infinite or NaN)")
                 return {'CANCELLED'}
             
-            # Create human-readable interpretation with numerical precision
-            epsilon = 1e-6  # Precision threshold for floating point comparisons
-            if abs(ratio - 1.0) < epsilon:
-                interpretation = "PERFECT - 1:1 UV to 3D ratio"
-            elif 0.99 <= ratio <= 1.01:
-                interpretation = "PERFECT - 1:1 UV to 3D ratio (within tolerance)"
-            elif ratio > 1.5:
-                interpretation = "UVs are MUCH LARGER than needed (stretched texture)"
-            elif ratio > 1.05:
-                interpretation = "UVs are larger than needed (some stretching)"
-            elif ratio < 0.5:
-                interpretation = "UVs are MUCH SMALLER than needed (compressed texture)"
-            elif ratio < 0.95:
-                interpretation = "UVs are smaller than needed (some compression)"
-            else:
-                interpretation = "Good ratio (minor deviation)"
-                
             # Format result strings
-            scope = "selected faces" if selected_faces else "all faces"
-            result = f"UV/3D Ratio: {ratio:.4f}"
-            details = (f"Interpretation: {interpretation}\n"
-                      f"Calculated from {face_count} {scope}\n"
-                      f"3D Area: {total_3d:.4f} units²\n"
-                      f"UV Area: {total_uv:.4f} units²\n"
-                      f"Time: {(time.time() - start_time):.3f}s")
-                      
-            context.scene.nazarick_uv_ratio_result = result
-            context.scene.nazarick_uv_ratio_details = details
+            scope = "selected faces" if len(selected_faces) else "all faces"
+            _store_ratio_result(context.scene, total_3d, total_uv,
+                                f"{face_count} {scope}", time.time() - start_time)
         else:
             self.report({'ERROR'}, "Could not calculate area (3D area is zero or invalid)")
+            context.scene.nazarick_uv_ratio_value = 0.0
             context.scene.nazarick_uv_ratio_result = "Error: No valid area found"
-            context.scene.nazarick_uv_ratio_details = "Please check your mesh."
+            _store_details(context.scene, "Please check your mesh.")
             return {'CANCELLED'}
             
         return {'FINISHED'}
@@ -183,16 +409,9 @@ class NazarickRatioPanelMixin:
             col = box.column(align=True)
             col.label(text=context.scene.nazarick_uv_ratio_result, icon='LIGHT_SUN')
             
-            # Draw multiline details with proper spacing
-            if context.scene.nazarick_uv_ratio_details:
-                for line in context.scene.nazarick_uv_ratio_details.split('\n'):
-                    if ':' in line:
-                        label, value = line.split(':', 1)
-                        row = col.row()
-                        row.label(text=label + ':')
-                        row.label(text=value)
-                    else:
-                        col.label(text=line)
+            # Draw multiline details, composed by the operator at one label per line
+            for item in context.scene.nazarick_uv_ratio_lines:
+                col.label(text=item.text)
                         
             # Add adjustment buttons if we have a result
             if "Error" not in context.scene.nazarick_uv_ratio_result:
@@ -246,6 +465,7 @@ class UV_OT_ScaleUVTo3D(bpy.types.Operator):
         return context.active_object and context.active_object.mode == 'EDIT'
     
     def execute(self, context):
+        start_time = time.time()
         obj = context.active_object
         bm = bmesh.from_edit_mesh(obj.data)
         uv_layer = bm.loops.layers.uv.active
@@ -255,48 +475,47 @@ class UV_OT_ScaleUVTo3D(bpy.types.Operator):
             return {'CANCELLED'}
             
         # Get current ratio from stored value
-        result_text = context.scene.nazarick_uv_ratio_result
-        try:
-            current_ratio = float(result_text.split(':')[1].strip())
-            target_ratio = 1.0  # We want a 1:1 ratio
-            scale_factor = (target_ratio / current_ratio) ** 0.5  # Square root because we scale in 2D
-        except:
-            scale_factor = 1.0
+        current_ratio = context.scene.nazarick_uv_ratio_value
+        if current_ratio <= 0:
+            self.report({'ERROR'}, "Calculate the UV/3D ratio first")
+            return {'CANCELLED'}
+        target_ratio = 1.0  # We want a 1:1 ratio
+        scale_factor = (target_ratio / current_ratio) ** 0.5  # Square root because we scale in 2D
             
-        # Get all unique UV coordinates to find center for scaling
-        all_uvs = []
-        for face in bm.faces:
-            for loop in face.loops:
-                all_uvs.append(loop[uv_layer].uv.copy())
-                
-        if not all_uvs:
+        if not bm.faces:
             self.report({'ERROR'}, "No UV coordinates found")
             return {'CANCELLED'}
+        
+        # Flush the BMesh into the mesh, scale every loop UV in bulk, then reload edit mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            uv_data = obj.data.uv_layers.active.data
+            uvs = np.empty(len(uv_data) * 2, dtype=np.float32)
+            uv_data.foreach_get('uv', uvs)
+            uvs_2d = uvs.reshape(-1, 2)
             
-        # Find UV center for scaling
-        min_u = min(uv.x for uv in all_uvs)
-        max_u = max(uv.x for uv in all_uvs)
-        min_v = min(uv.y for uv in all_uvs)
-        max_v = max(uv.y for uv in all_uvs)
-        center_u = (min_u + max_u) / 2
-        center_v = (min_v + max_v) / 2
+            # Scale all UVs around their current bounding-box center
+            center = 0.5 * (uvs_2d.min(axis=0) + uvs_2d.max(axis=0))
+            uvs_2d -= center
+            uvs_2d *= scale_factor
+            uvs_2d += center
+            uv_data.foreach_set('uv', uvs)
+        finally:
+            bpy.ops.object.mode_set(mode='EDIT')
         
-        # Scale all UVs around the center
-        for face in bm.faces:
-            for loop in face.loops:
-                uv = loop[uv_layer].uv
-                uv.x = center_u + (uv.x - center_u) * scale_factor
-                uv.y = center_v + (uv.y - center_v) * scale_factor
-                
-        bmesh.update_edit_mesh(obj.data)
+        _invalidate_loop_buffers(obj.data)
         self.report({'INFO'}, f"UVs scaled by {scale_factor:.4f} to achieve 1:1 ratio")
         
-        # Update the ratio display
-        bpy.ops.uv.nazarick_total_uv_3d_ratio()
+        # Update the ratio display in place: UV area scales with the square of the factor
+        scene = context.scene
+        _store_ratio_result(scene, scene.nazarick_uv_ratio_total_3d,
+                            scene.nazarick_uv_ratio_total_uv * scale_factor ** 2,
+                            scene.nazarick_uv_ratio_source, time.time() - start_time)
         
         return {'FINISHED'}
 
 classes = (
+    NazarickLineItem,
     UV_OT_TotalUV3DRatio,
     UV_PT_NazarickRatioPanel,
     VIEW3D_PT_NazarickRatioPanel,
@@ -318,13 +537,57 @@ def register():
         default="",
         description="Detailed information about the UV/3D ratio"
     )
+    
+    bpy.types.Scene.nazarick_uv_ratio_lines = bpy.props.CollectionProperty(
+        type=NazarickLineItem,
+        name="UV/3D Ratio Detail Lines",
+        description="Detail lines split once per measurement for drawing"
+    )
+    
+    bpy.types.Scene.nazarick_uv_ratio_value = bpy.props.FloatProperty(
+        name="UV/3D Ratio Value",
+        default=0.0,
+        description="Numeric UV/3D ratio from the last measurement (0 when unavailable)"
+    )
+    
+    bpy.types.Scene.nazarick_uv_ratio_total_3d = bpy.props.FloatProperty(
+        name="UV/3D Ratio 3D Area",
+        default=0.0,
+        description="Total 3D surface area from the last UV/3D ratio measurement"
+    )
+    
+    bpy.types.Scene.nazarick_uv_ratio_total_uv = bpy.props.FloatProperty(
+        name="UV/3D Ratio UV Area",
+        default=0.0,
+        description="Total UV area from the last UV/3D ratio measurement"
+    )
+    
+    bpy.types.Scene.nazarick_uv_ratio_source = bpy.props.StringProperty(
+        name="UV/3D Ratio Source",
+        default="",
+        description="Faces the last UV/3D ratio measurement was taken from"
+    )
+    
+    bpy.app.handlers.depsgraph_update_post.append(_drop_edited_loop_buffers)
+    bpy.app.handlers.load_pre.append(_drop_all_loop_buffers)
 
 def unregister():
+    if _drop_edited_loop_buffers in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_drop_edited_loop_buffers)
+    if _drop_all_loop_buffers in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_drop_all_loop_buffers)
+    _loop_buffer_cache.clear()
+    
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     
     del bpy.types.Scene.nazarick_uv_ratio_result
     del bpy.types.Scene.nazarick_uv_ratio_details
+    del bpy.types.Scene.nazarick_uv_ratio_lines
+    del bpy.types.Scene.nazarick_uv_ratio_value
+    del bpy.types.Scene.nazarick_uv_ratio_total_3d
+    del bpy.types.Scene.nazarick_uv_ratio_total_uv
+    del bpy.types.Scene.nazarick_uv_ratio_source
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+🏰⚡ NAZARICK FORTRESS BATCH DRIVER ⚡🏰
+======================================
+
+Runs several fortress test suites in one child interpreter so isolated runs
+pay one interpreter startup per batch instead of one per suite.
+
+Usage (invoked by run_tests.py --isolate):
+    python3 _batch_driver.py SUITE_FILE [SUITE_FILE ...]
+
+Each suite's output goes to its own log, exactly as an in-process run would
+write it; one JSON line {"file": ..., "rc": ...} per suite is printed to
+stdout for the runner to collect.
+"""
+
+import json
+import sys
+
+from run_tests import _run_suite_in_process
+
+def main():
+    """Run each suite named on the command line and report its exit code"""
+    report = sys.stdout
+    for suite_file in sys.argv[1:]:
+        returncode = _run_suite_in_process({'file': suite_file})
+        report.write(json.dumps({'file': suite_file, 'rc': returncode}) + "\n")
+        report.flush()
+
+if __name__ == "__main__":
+    main()
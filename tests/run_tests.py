@@ -7,7 +7,16 @@ Supreme test orchestration for all fortress validation systems.
 Ensures every component meets the exacting standards of Nazarick.
 
 Usage:
-    python3 run_tests.py
+    python3 run_tests.py [--no-cache] [--isolate] [-x | --fail-fast]
+
+    --no-cache  Re-run every suite even if it passed last time and nothing
+                it inspects has changed since
+    --isolate   Run suites in child interpreters, batched a few per child,
+                instead of in-process (for suites that may crash the
+                interpreter)
+    -x, --fail-fast
+                Stop after the first suite that fails; later suites are
+                neither run nor reported
 
 Architect: Demiurge | Creator: Albedo | Overlord: Ainz Ooal Gown
 For the Glory of the Great Tomb of Nazarick! 🏰
@@ -16,100 +25,315 @@ For the Glory of the Great Tomb of Nazarick! 🏰
 import subprocess
 import sys
 import os
-# Add parent directory to path to import from src
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from src.utils.fortress_banner import display_fortress_banner, display_testing_header
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import runpy
+import shutil
+import traceback
 
-def main():
-    """Run all fortress validation tests"""
-    # Display the magnificent fortress banner
-    display_fortress_banner(compact=True)
-    print()
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.dirname(_TESTS_DIR)
+
+# Add parent directory to path to import from src (the banner is drawn by this process)
+sys.path.insert(0, _REPO_ROOT)
+from src.utils.fortress_banner import render_fortress_banner, render_testing_header
+
+_CACHE_DIR = os.path.join(_TESTS_DIR, '.nazarick_test_cache')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'index.json')
+
+# Report rules, built once
+_SEP = "🏰" + "=" * 78 + "🏰"
+_DASH = "─" * 60
+
+# Trees the suites scan for addons; their sources are part of every cache key
+_INSPECTED_DIRS = ('testing_addons', 'developing_addons', 'src')
+
+# Suites are throwaway runs; keep children from writing bytecode or pytest caches into the tree.
+# Children find src through PYTHONPATH rather than each patching its own sys.path.
+_CHILD_ENV = {**os.environ, 'PYTEST_ADDOPTS': '-p no:cacheprovider', 'PYTHONDONTWRITEBYTECODE': '1',
+              'PYTHONPATH': os.pathsep.join(filter(None, (_REPO_ROOT, os.environ.get('PYTHONPATH'))))}
+
+# Isolated suites share one child interpreter per batch to amortize its startup
+_BATCH_DRIVER = os.path.join(_TESTS_DIR, '_batch_driver.py')
+_BATCH_SIZE = 4
+
+# Available fortress testing components
+TEST_SUITES = [
+    {
+        'name': 'Blender 4.2.x LTS Compatibility Framework',
+        'file': 'test_blender42_compatibility.py',
+        'description': 'Generic Blender 4.2.x LTS API compatibility validation framework'
+    },
+    {
+        'name': 'Blender 4.5+ Compatibility Framework',
+        'file': 'test_blender45_compatibility.py',
+        'description': 'Generic Blender 4.5+ API compatibility validation framework'
+    },
+    {
+        'name': 'Real Environment Framework Testing', 
+        'file': 'test_real_environment.py',
+        'description': 'Generic real Blender environment framework validation'
+    },
+    {
+        'name': 'Quick Validation Framework',
+        'file': 'test_simple_validation.py', 
+        'description': 'Rapid generic compatibility verification'
+    }
+]
+
+def _file_hash(path):
+    """Digest of one file's bytes"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _inspected_sources_hash():
+    """Digest of the interpreter version and every .py file the suites inspect"""
+    digest = hashlib.blake2b(sys.version.encode(), digest_size=16)
+    for top in _INSPECTED_DIRS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(_REPO_ROOT, top)):
+            dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+            for name in sorted(filenames):
+                if name.endswith('.py'):
+                    path = os.path.join(dirpath, name)
+                    digest.update(os.path.relpath(path, _REPO_ROOT).encode())
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+    return digest.hexdigest()
+
+def _load_cache():
+    """Previous per-suite results, or an empty cache if missing or unreadable"""
+    try:
+        with open(_CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _store_cache(cache):
+    """Write the per-suite results atomically so an interrupted run never corrupts them"""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    tmp_file = f"{_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_file, _CACHE_FILE)
+    except OSError:
+        pass
+
+def _log_path(suite):
+    """File holding a suite's combined stdout/stderr from its latest run"""
+    return os.path.join(_CACHE_DIR, suite['file'] + '.log')
+
+def _completed(returncode):
+    """Future already resolved to a suite's exit code"""
+    future = concurrent.futures.Future()
+    future.set_result(returncode)
+    return future
+
+def _run_batch(batch):
+    """Run (suite, future) pairs in one child interpreter, resolving each future with the suite's exit code"""
+    try:
+        while batch:
+            proc = subprocess.Popen([sys.executable, '-B', _BATCH_DRIVER] + [suite['file'] for suite, _ in batch],
+                                    stdout=subprocess.PIPE, text=True, env=_CHILD_ENV)
+            # The driver reports suites in the order given; anything a crashing suite
+            # writes straight to the descriptor is not a report line
+            reported = 0
+            for line in proc.stdout:
+                try:
+                    report = json.loads(line)
+                    suite, future = batch[reported]
+                    if report['file'] != suite['file']:
+                        continue
+                except (ValueError, TypeError, KeyError, IndexError):
+                    continue
+                future.set_result(report['rc'])
+                reported += 1
+            returncode = proc.wait()
+            if reported < len(batch):
+                # The suite that was running died with the child
+                suite, future = batch[reported]
+                with open(_log_path(suite), 'a', encoding='utf-8') as log:
+                    log.write(f"💥 Batch interpreter exited (code {returncode}) before this suite finished\n")
+                future.set_result(returncode or 1)
+                reported += 1
+            # Suites the crash kept from starting run again in a fresh child
+            batch = batch[reported:]
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+
+def _run_suite_in_process(suite):
+    """Run one test suite as __main__ in this interpreter and return its exit code"""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    saved_argv = sys.argv
+    sys.argv = [suite['file']]
+    # Line-buffered so a suite that kills the interpreter still leaves its output behind
+    with open(_log_path(suite), 'w', encoding='utf-8', buffering=1) as log:
+        try:
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                runpy.run_path(suite['file'], run_name='__main__')
+            returncode = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                log.write(f"{e.code}\n")
+                returncode = 1
+        except Exception:
+            log.write(traceback.format_exc())
+            returncode = 1
+        finally:
+            sys.argv = saved_argv
+    return returncode
+
+def _replay_log(suite):
+    """Copy a suite's log to stdout in fixed-size chunks; True if it had any output"""
+    sys.stdout.flush()
+    with open(_log_path(suite), 'rb') as log:
+        shutil.copyfileobj(log, sys.stdout.buffer)
+        wrote = log.tell() > 0
+    sys.stdout.buffer.flush()
+    return wrote
+
+def run_suites(test_suites):
+    """Run the given fortress test suites and report; True if every suite passed"""
+    total_tests = 0
+    successful_tests = 0
     
-    display_testing_header("FORTRESS COMPREHENSIVE VALIDATION")
+    # Skip suites that passed last time when neither they nor the addons they inspect changed
+    cache = _load_cache()
+    use_cache = '--no-cache' not in sys.argv[1:]
+    isolate = '--isolate' in sys.argv[1:]
+    fail_fast = '-x' in sys.argv[1:] or '--fail-fast' in sys.argv[1:]
+    sources_hash = _inspected_sources_hash()
+    # One directory read instead of a stat per suite; suite paths resolve against the working directory
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+    suite_keys = {suite['file']: _file_hash(suite['file']) + sources_hash
+                  for suite in test_suites if suite['file'] in present}
     
-    # Available fortress testing components
-    test_suites = [
-        {
-            'name': 'Blender 4.2.x LTS Compatibility Framework',
-            'file': 'test_blender42_compatibility.py',
-            'description': 'Generic Blender 4.2.x LTS API compatibility validation framework'
-        },
-        {
-            'name': 'Blender 4.5+ Compatibility Framework',
-            'file': 'test_blender45_compatibility.py',
-            'description': 'Generic Blender 4.5+ API compatibility validation framework'
-        },
-        {
-            'name': 'Real Environment Framework Testing', 
-            'file': 'test_real_environment.py',
-            'description': 'Generic real Blender environment framework validation'
-        },
-        {
-            'name': 'Quick Validation Framework',
-            'file': 'test_simple_validation.py', 
-            'description': 'Rapid generic compatibility verification'
-        }
-    ]
+    # Isolated batches are subprocess-bound, so threads overlap them; leave two cores of headroom.
+    workers = max(1, (os.cpu_count() or 1) - 2)
+    pending = []
+    replayed = set()
     
-    total_tests = 0
-    successful_tests = 0
+    def schedule():
+        """Yield (suite, future) in suite order; in-process suites run only when reached"""
+        for suite in test_suites:
+            entry = cache.get(suite['file'])
+            if suite['file'] not in suite_keys:
+                yield suite, None
+            elif (use_cache and entry and entry['hash'] == suite_keys[suite['file']]
+                    and entry['rc'] == 0 and os.path.exists(_log_path(suite))):
+                replayed.add(suite['file'])
+                yield suite, _completed(0)
+            elif isolate:
+                pending.append((suite, concurrent.futures.Future()))
+                yield pending[-1]
+            else:
+                # In-process suites swap the global stdout, so each runs just before its report
+                yield suite, _completed(_run_suite_in_process(suite))
     
-    for suite in test_suites:
-        if os.path.exists(suite['file']):
-            print(f"\n⚡ Activating: {suite['name']}")
-            print(f"📋 Description: {suite['description']}")
-            print(f"🔧 Test File: {suite['file']}")
-            print("─" * 60)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        scheduled = schedule()
+        if isolate:
+            scheduled = list(scheduled)
+        
+        if pending:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            # Spread batches over the workers so small suite lists still run in parallel
+            batch_size = min(_BATCH_SIZE, -(-len(pending) // workers))
+            for start in range(0, len(pending), batch_size):
+                executor.submit(_run_batch, pending[start:start + batch_size])
+        
+        # Report in suite order; each suite's output streams to its own log, so blocks never interleave
+        reported = 0
+        for suite, future in scheduled:
+            reported += 1
+            if future is None:
+                print(f"\n🔍 {suite['name']} - Test file not found: {suite['file']}")
+                continue
             
+            out = [f"\n⚡ Activating: {suite['name']}",
+                   f"📋 Description: {suite['description']}",
+                   f"🔧 Test File: {suite['file']}",
+                   _DASH]
             try:
-                result = subprocess.run([sys.executable, suite['file']], 
-                                      capture_output=True, text=True)
-                
+                returncode = future.result()
                 total_tests += 1
                 
-                # Display output
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr and result.stderr.strip():
-                    print("⚠️ Warnings/Errors:", result.stderr)
+                if suite['file'] in replayed:
+                    out.append("♻️ Unchanged since its last successful run - replaying cached output")
+                else:
+                    cache[suite['file']] = {'hash': suite_keys[suite['file']], 'rc': returncode}
+                
+                # Display output (stdout and stderr were merged in the log)
+                sys.stdout.write("\n".join(out) + "\n")
+                out = []
+                if _replay_log(suite):
+                    sys.stdout.write("\n")
                 
-                if result.returncode == 0:
-                    print(f"✅ {suite['name']} - VALIDATION SUCCESSFUL")
+                if returncode == 0:
+                    out.append(f"✅ {suite['name']} - VALIDATION SUCCESSFUL")
                     successful_tests += 1
                 else:
-                    print(f"❌ {suite['name']} - VALIDATION FAILED (Exit code: {result.returncode})")
+                    out.append(f"❌ {suite['name']} - VALIDATION FAILED (Exit code: {returncode})")
                     
             except Exception as e:
-                print(f"💥 Error executing {suite['name']}: {e}")
+                out.append(f"💥 Error executing {suite['name']}: {e}")
                 total_tests += 1
-        else:
-            print(f"\n🔍 {suite['name']} - Test file not found: {suite['file']}")
+                returncode = 1
+            sys.stdout.write("\n".join(out) + "\n")
+            # Flush each report so a later suite that kills the interpreter cannot take it down too
+            sys.stdout.flush()
+            
+            if fail_fast and returncode != 0:
+                # Batches already running finish; queued ones are dropped
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+        
+        if reported < len(test_suites):
+            print(f"\n⏹️ Fail-fast: skipped {len(test_suites) - reported} remaining suite(s)")
     
-    # Display fortress validation summary
-    print("\n" + "🏰" + "="*78 + "🏰")
-    print("⚡ FORTRESS VALIDATION SUMMARY ⚡")
-    print("🏰" + "="*78 + "🏰")
+    _store_cache(cache)
     
-    print(f"📊 Total Test Suites: {total_tests}")
-    print(f"✅ Successful Validations: {successful_tests}")
-    print(f"❌ Failed Validations: {total_tests - successful_tests}")
+    # Display fortress validation summary in one write
+    lines = ["\n" + _SEP,
+             "⚡ FORTRESS VALIDATION SUMMARY ⚡",
+             _SEP,
+             f"📊 Total Test Suites: {total_tests}",
+             f"✅ Successful Validations: {successful_tests}",
+             f"❌ Failed Validations: {total_tests - successful_tests}"]
     
     if successful_tests == total_tests and total_tests > 0:
-        print("\n🏆 FORTRESS STATUS: SUPREMELY OPERATIONAL ⚡")
-        print("🎉 All fortress components validated successfully!")
-        print("🏰 The fortress stands ready to validate all future addons!")
-        print("\nFOR THE ETERNAL GLORY OF NAZARICK! 🏰⚡🏰")
-        return True
+        lines += ["\n🏆 FORTRESS STATUS: SUPREMELY OPERATIONAL ⚡",
+                  "🎉 All fortress components validated successfully!",
+                  "🏰 The fortress stands ready to validate all future addons!",
+                  "\nFOR THE ETERNAL GLORY OF NAZARICK! 🏰⚡🏰"]
+        passed = True
     elif successful_tests > 0:
-        print(f"\n⚠️ FORTRESS STATUS: PARTIALLY OPERATIONAL")
-        print(f"🔧 {successful_tests}/{total_tests} fortress components operational")
-        print("🛠️ Some fortress systems require attention")
-        return False
+        lines += ["\n⚠️ FORTRESS STATUS: PARTIALLY OPERATIONAL",
+                  f"🔧 {successful_tests}/{total_tests} fortress components operational",
+                  "🛠️ Some fortress systems require attention"]
+        passed = False
     else:
-        print("\n💥 FORTRESS STATUS: REQUIRES IMMEDIATE ATTENTION")
-        print("🚨 Critical fortress systems need investigation")
-        return False
+        lines += ["\n💥 FORTRESS STATUS: REQUIRES IMMEDIATE ATTENTION",
+                  "🚨 Critical fortress systems need investigation"]
+        passed = False
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return passed
+
+def main():
+    """Run all fortress validation tests"""
+    # Display the magnificent fortress banner and header in one write
+    sys.stdout.write(render_fortress_banner(compact=True) + "\n"
+                     + render_testing_header("FORTRESS COMPREHENSIVE VALIDATION"))
+    
+    return run_suites(TEST_SUITES)
 
 if __name__ == "__main__":
     success = main()